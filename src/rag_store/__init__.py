@@ -6,7 +6,19 @@ Can be deployed separately from the search service.
 """
 
 from .pdf_processor import PDFProcessor
-from .store_embeddings import ModelVendor, load_embedding_model, store_to_chroma
 from ._version import __version__
 
+# Resolved on first access so that importing a processor does not pull in
+# ChromaDB and the embedding provider SDKs
+_STORE_EMBEDDINGS_EXPORTS = ("ModelVendor", "load_embedding_model", "store_to_chroma")
+
+
+def __getattr__(name):
+    if name in _STORE_EMBEDDINGS_EXPORTS:
+        from . import store_embeddings
+
+        return getattr(store_embeddings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["ModelVendor", "PDFProcessor", "load_embedding_model", "store_to_chroma", "__version__"]
@@ -36,6 +36,9 @@ class DocumentProcessor(ABC):
         self.default_chunk_size: int = 1000
         self.default_chunk_overlap: int = 100
         self.processor_name: str = self.__class__.__name__
+        # False for CPU-bound or thread-unsafe parsers, which callers keep
+        # out of worker threads
+        self.io_bound: bool = True
 
     @property
     @abstractmethod
@@ -115,7 +118,7 @@ class DocumentProcessor(ABC):
         if not self.is_supported_file(file_path):
             raise ValueError(
                 f"Unsupported file type: {file_path.suffix}. "
-                f"Supported types: {self.supported_extensions}"
+                f"Supported types: {sorted(self.supported_extensions)}"
             )
 
     def get_processing_params(
@@ -151,6 +154,8 @@ class ProcessorRegistry:
     def __init__(self):
         self._processors: dict[str, DocumentProcessor] = {}
         self._extension_map: dict[str, str] = {}
+        # Rebuilt lazily after each registration
+        self._supported_extensions: frozenset[str] | None = None
 
     def register_processor(self, processor: DocumentProcessor) -> None:
         """
@@ -165,6 +170,7 @@ class ProcessorRegistry:
         # Map file extensions to processor
         for extension in processor.supported_extensions:
             self._extension_map[extension.lower()] = processor_name
+        self._supported_extensions = None
 
         log_registry_operation(
             "register_processor",
@@ -191,9 +197,11 @@ class ProcessorRegistry:
 
         return None
 
-    def get_supported_extensions(self) -> set[str]:
-        """Get all supported file extensions."""
-        return set(self._extension_map.keys())
+    def get_supported_extensions(self) -> frozenset[str]:
+        """Get all supported file extensions (cached until the next registration)."""
+        if self._supported_extensions is None:
+            self._supported_extensions = frozenset(self._extension_map)
+        return self._supported_extensions
 
     def get_all_processors(self) -> dict[str, DocumentProcessor]:
         """Get all registered processors."""
@@ -229,11 +237,11 @@ class ProcessorRegistry:
                 "processor_lookup_failed",
                 file_path=str(file_path),
                 file_extension=file_path.suffix,
-                supported_extensions=list(self.get_supported_extensions()),
+                supported_extensions=sorted(self.get_supported_extensions()),
             )
             raise ValueError(
                 f"No processor found for file type: {file_path.suffix}. "
-                f"Supported extensions: {self.get_supported_extensions()}"
+                f"Supported extensions: {sorted(self.get_supported_extensions())}"
             )
 
         log_registry_operation(
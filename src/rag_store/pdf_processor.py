@@ -6,22 +6,54 @@ them into LangChain Document objects for embedding storage.
 Uses PyMuPDF for OCR capabilities to handle image-based PDFs.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import itertools
+import json
+import multiprocessing
+import os
 import time
 import fitz  # PyMuPDF
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
 from io import BytesIO
 
 from pathlib import Path
+from typing import Any
 
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
-# OCR dependencies (optional)
+# OCR dependencies (optional). Only probe for them here: pytesseract and PIL
+# are imported on first OCR use, keeping them off the module import path.
+OCR_AVAILABLE = (
+    importlib.util.find_spec("pytesseract") is not None
+    and importlib.util.find_spec("PIL") is not None
+)
+
+# Rust-backed character splitter (optional)
+try:
+    from semantic_text_splitter import TextSplitter
+    SEMANTIC_SPLITTER_AVAILABLE = True
+except ImportError:
+    SEMANTIC_SPLITTER_AVAILABLE = False
+
+# Fast JSON serialization for the chunk cache (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Layout-aware markdown extraction (optional)
 try:
-    import pytesseract
-    from PIL import Image
-    OCR_AVAILABLE = True
+    import pymupdf4llm
+    MARKDOWN_EXTRACTION_AVAILABLE = True
 except ImportError:
-    OCR_AVAILABLE = False
+    MARKDOWN_EXTRACTION_AVAILABLE = False
 
 try:
     from .document_processor import DocumentProcessor
@@ -43,24 +75,179 @@ except ImportError:
 logger = get_logger("pdf_processor")
 
 
+# Bump whenever the chunk output or the cache file layout changes, so stale
+# cache entries are never served
+CHUNK_CACHE_VERSION = 2
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Start method for worker-process pools. Forking a process that already runs
+# threads (an event loop's executor, a pool's manager thread) can deadlock the
+# child, so prefer forkserver and fall back to spawn
+PROCESS_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+@lru_cache(maxsize=1)
+def get_pdf_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool shared by async PDF parsing (built once per process).
+
+    The pool lives until interpreter exit, so cancelling an async caller never
+    waits on a pool shutdown. Use get_pdf_process_pool.cache_clear() to get a
+    fresh pool.
+
+    Returns:
+        ProcessPoolExecutor with min(cpu_count, 4) workers
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, 4), mp_context=PROCESS_POOL_CONTEXT
+    )
+
+
+def _case_variants(suffix: str) -> frozenset[str]:
+    """Return every upper/lower case spelling of an ASCII file suffix."""
+    return frozenset(
+        "".join(chars)
+        for chars in itertools.product(*({c.lower(), c.upper()} for c in suffix))
+    )
+
+
+@dataclass(slots=True, eq=False)
+class ChunkMeta(Mapping):
+    """
+    Compact, read-only mapping for PDF chunk metadata in the chunk cache.
+
+    Holds the same keys PDFProcessor writes into a metadata dict, in slots
+    instead of a per-chunk hash table, and serializes to a positional row so
+    cache files do not repeat the keys on every chunk. Optional keys left as
+    None are hidden, so the mapping view matches the dict it replaces.
+    Documents always carry the plain dict from as_dict().
+    """
+
+    source: str
+    file_path: str
+    file_type: str
+    processor: str
+    file_size: int
+    document_id: str
+    chunk_id: str
+    chunk_size: int
+    chunk_overlap: int
+    splitting_method: str
+    loader_type: str
+    total_chunks: int | None = None
+    page: int | None = None
+    extraction_method: str | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _CHUNK_META_FIELDS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in _CHUNK_META_FIELDS if getattr(self, name) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metadata as a plain dict."""
+        return dict(self)
+
+    def as_row(self) -> list[Any]:
+        """Return every field value in declaration order; ChunkMeta(*row) restores it."""
+        return [getattr(self, name) for name in _CHUNK_META_FIELDS]
+
+
+_CHUNK_META_FIELDS = tuple(field.name for field in fields(ChunkMeta))
+
+
 class PDFProcessor(DocumentProcessor):
     """Process PDF files and extract text content for RAG storage using PyMuPDF with OCR capabilities."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        use_rust_splitter: bool = False,
+        cache_dir: Path | None = None,
+    ):
+        """
+        Initialize the PDF processor.
+
+        Args:
+            use_rust_splitter: Split text with the Rust semantic-text-splitter
+                package instead of RecursiveCharacterTextSplitter. Falls back
+                to the LangChain splitter when the package is not installed.
+            cache_dir: Directory for the on-disk chunk cache. Chunks are keyed
+                by the SHA-256 of the PDF bytes and the chunking parameters,
+                so re-ingesting an unchanged PDF skips parsing. None disables it.
+        """
         super().__init__()
         self.supported_extensions = {".pdf"}
         # Optimized chunking parameters based on industry best practices (2024)
         self.default_chunk_size = 1800  # Technical content benefits from larger context
         self.default_chunk_overlap = 270  # 15% overlap ratio
+        # PyMuPDF is CPU-bound and not thread-safe
+        self.io_bound = False
+        # Splitters are reused across files with the same chunking parameters
+        self._splitter_cache: dict[
+            tuple[int, int], RecursiveCharacterTextSplitter
+        ] = {}
+        self._rust_splitter_cache: dict[tuple[int, int], "TextSplitter"] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        if use_rust_splitter and not SEMANTIC_SPLITTER_AVAILABLE:
+            logger.warning(
+                "semantic-text-splitter not installed, falling back to "
+                "RecursiveCharacterTextSplitter. Install mcp-rag[rust-splitter] to enable it."
+            )
+        self.use_rust_splitter = use_rust_splitter and SEMANTIC_SPLITTER_AVAILABLE
+        self.splitting_method = (
+            "SemanticTextSplitter"
+            if self.use_rust_splitter
+            else "RecursiveCharacterTextSplitter"
+        )
 
     @property
     def file_type_description(self) -> str:
         """Return a human-readable description of supported file types."""
         return "PDF documents (.pdf) with OCR support"
 
+    @property
+    def supported_extensions(self) -> frozenset[str]:
+        """Supported extensions; assign a new collection to change them."""
+        return self._supported_extensions
+
+    @supported_extensions.setter
+    def supported_extensions(self, extensions: Iterable[str]) -> None:
+        self._supported_extensions = frozenset(ext.lower() for ext in extensions)
+        # All case spellings of each extension, so suffix checks skip str.lower()
+        self._suffix_variants = frozenset(
+            variant
+            for ext in self._supported_extensions
+            for variant in _case_variants(ext)
+        )
+
     def is_supported_file(self, file_path: Path) -> bool:
         """Check if the file is a supported PDF file."""
-        return file_path.suffix.lower() in self.supported_extensions
+        return file_path.suffix in self._suffix_variants
 
     # Legacy method for backward compatibility
     def is_pdf_file(self, file_path: Path) -> bool:
@@ -81,19 +268,133 @@ class PDFProcessor(DocumentProcessor):
             file_path: Path to the PDF file
             chunk_size: Maximum size of each text chunk
             chunk_overlap: Number of characters to overlap between chunks
-            **kwargs: Additional processing parameters
+            **kwargs: Additional processing parameters; page_limit restricts
+                processing to the first N pages
 
         Returns:
             List of LangChain Document objects with content and metadata
         """
         self.validate_file(file_path)
-        return self._process_pdf_internal(file_path, chunk_size, chunk_overlap)
+        return self._process_pdf_internal(
+            file_path, chunk_size, chunk_overlap, page_limit=kwargs.get("page_limit")
+        )
+
+    def process_many(
+        self,
+        file_paths: Iterable[Path],
+        num_workers: int | None = None,
+        progress_cb: Callable[[int, int], None] | None = None,
+    ) -> list[Document]:
+        """
+        Process several PDF documents in parallel worker processes.
+
+        PDF parsing is CPU-bound, so files are spread across a process pool.
+        Chunk metadata such as total_chunks stays per file, and documents are
+        returned in input order regardless of which file finishes first.
+
+        Args:
+            file_paths: Paths to the PDF files
+            num_workers: Number of worker processes (defaults to min(cpu_count, 4));
+                1 processes the files sequentially in the current process
+            progress_cb: Optional callback invoked as progress_cb(done, total)
+
+        Returns:
+            List of LangChain Document objects from all files
+        """
+        paths = list(file_paths)
+        total = len(paths)
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, 4)
+
+        results: list[list[Document]] = [[] for _ in paths]
+
+        if num_workers <= 1 or total <= 1:
+            for index, path in enumerate(paths):
+                results[index] = self.process_document(path)
+                if progress_cb:
+                    progress_cb(index + 1, total)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(num_workers, total), mp_context=PROCESS_POOL_CONTEXT
+            ) as executor:
+                futures = {
+                    executor.submit(self.process_document, path): index
+                    for index, path in enumerate(paths)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    results[futures[future]] = future.result()
+                    if progress_cb:
+                        progress_cb(done, total)
+
+        return [doc for docs in results for doc in docs]
+
+    async def pdf_to_documents_recursive_async(
+        self,
+        pdf_path: Path,
+        executor: Executor | None = None,
+        **kwargs,
+    ) -> list[Document]:
+        """
+        Async variant of pdf_to_documents_recursive for event-loop callers.
+
+        Parsing runs in a worker process via loop.run_in_executor, so the
+        event loop stays responsive while the PDF is processed. PyMuPDF is
+        not thread-safe and holds the GIL, so worker threads would not help.
+
+        Args:
+            pdf_path: Path to the PDF file
+            executor: Pool to parse in (defaults to get_pdf_process_pool())
+            **kwargs: Passed through to pdf_to_documents_recursive
+
+        Returns:
+            List of LangChain Document objects
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor or get_pdf_process_pool(),
+            partial(self.pdf_to_documents_recursive, pdf_path, **kwargs),
+        )
+
+    async def process_many_async(
+        self,
+        file_paths: Iterable[Path],
+        max_concurrency: int = 4,
+        executor: Executor | None = None,
+        **kwargs,
+    ) -> list[Document]:
+        """
+        Process several PDF documents concurrently from async code.
+
+        Files are parsed in worker processes, the same way process_many
+        spreads CPU-bound parsing, with at most max_concurrency files
+        submitted at a time.
+
+        Args:
+            file_paths: Paths to the PDF files
+            max_concurrency: Maximum number of PDFs parsed at the same time
+            executor: Pool to parse in (defaults to get_pdf_process_pool())
+            **kwargs: Passed through to pdf_to_documents_recursive
+
+        Returns:
+            List of LangChain Document objects from all files, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def parse(path: Path) -> list[Document]:
+            async with semaphore:
+                return await self.pdf_to_documents_recursive_async(
+                    path, executor=executor, **kwargs
+                )
+
+        results = await asyncio.gather(*(parse(path) for path in file_paths))
+        return [doc for docs in results for doc in docs]
 
     def _process_pdf_internal(
         self,
         pdf_path: Path,
         chunk_size: int | None = None,
         chunk_overlap: int | None = None,
+        page_limit: int | None = None,
     ) -> list[Document]:
         """Internal PDF processing method using PyMuPDF with OCR capabilities."""
         start_time = time.time()
@@ -111,11 +412,34 @@ class PDFProcessor(DocumentProcessor):
         )
 
         try:
-            # Use PyMuPDF for OCR-capable PDF processing
-            doc = fitz.open(str(pdf_path))
-            
-            if doc.page_count == 0:
-                doc.close()
+            cache_path = None
+            if self.cache_dir is not None:
+                cache_path = self._chunk_cache_path(
+                    pdf_path, chunk_size, chunk_overlap, page_limit
+                )
+                documents = self._read_chunk_cache(cache_path)
+                if documents is not None:
+                    # The same bytes may now live at a different path
+                    path_metadata = self._chunk_base_metadata(
+                        pdf_path, chunk_size, chunk_overlap
+                    )
+                    for doc in documents:
+                        doc.metadata.update(path_metadata)
+                    log_document_processing_complete(
+                        context=context,
+                        chunks_created=len(documents),
+                        processing_time_seconds=time.time() - start_time,
+                        status="success_cached",
+                    )
+                    return documents
+
+            # Pages stream straight into the splitter; only chunks are kept,
+            # since total_chunks must be known before metadata is written
+            documents = list(
+                self._iter_pdf_chunks(pdf_path, chunk_size, chunk_overlap, page_limit)
+            )
+
+            if not documents:
                 log_document_processing_complete(
                     context=context,
                     chunks_created=0,
@@ -124,19 +448,325 @@ class PDFProcessor(DocumentProcessor):
                 )
                 return []
 
+            # Enhance metadata with processing information
+            base_metadata = self._chunk_base_metadata(
+                pdf_path, chunk_size, chunk_overlap
+            )
+            base_metadata["total_chunks"] = len(documents)
+            for i, doc in enumerate(documents):
+                # Preserve original page metadata and add our enhancements
+                doc.metadata.update(base_metadata)
+                doc.metadata["chunk_id"] = f"chunk_{i}"
+
+            if cache_path is not None:
+                self._write_chunk_cache(cache_path, documents)
+
+            # Log successful completion
+            processing_time = time.time() - start_time
+            log_document_processing_complete(
+                context=context,
+                chunks_created=len(documents),
+                processing_time_seconds=processing_time,
+                status="success",
+            )
+
+            return documents
+
+        except Exception as e:
+            # Log error
+            log_processing_error(
+                context=context, error=e, error_type="pdf_processing_error"
+            )
+            raise Exception(f"Error processing PDF {pdf_path}: {e!s}")
+
+    def pdf_to_documents_recursive_iter(
+        self,
+        pdf_path: Path,
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+        page_limit: int | None = None,
+    ) -> Iterator[Document]:
+        """
+        Stream chunks of a PDF file page by page instead of building a list.
+
+        Only one page and its chunks are held in memory at a time. Because the
+        chunk count is unknown until the last page, total_chunks is omitted
+        from the metadata; all other keys match pdf_to_documents_recursive.
+
+        Args:
+            pdf_path: Path to the PDF file
+            chunk_size: Maximum size of each text chunk
+            chunk_overlap: Number of characters to overlap between chunks
+            page_limit: Only process the first N pages (None processes all)
+
+        Yields:
+            LangChain Document objects in page order
+        """
+        self.validate_file(pdf_path)
+        start_time = time.time()
+        chunk_size, chunk_overlap = self.get_processing_params(
+            chunk_size, chunk_overlap
+        )
+
+        file_size = pdf_path.stat().st_size if pdf_path.exists() else 0
+        context = log_document_processing_start(
+            processor_name=self.processor_name,
+            file_path=str(pdf_path),
+            file_size=file_size,
+            file_type=pdf_path.suffix,
+        )
+
+        base_metadata = self._chunk_base_metadata(pdf_path, chunk_size, chunk_overlap)
+        chunks_created = 0
+        try:
+            for doc in self._iter_pdf_chunks(
+                pdf_path, chunk_size, chunk_overlap, page_limit
+            ):
+                doc.metadata.update(base_metadata)
+                doc.metadata["chunk_id"] = f"chunk_{chunks_created}"
+                chunks_created += 1
+                yield doc
+        except Exception as e:
+            log_processing_error(
+                context=context, error=e, error_type="pdf_processing_error"
+            )
+            raise Exception(f"Error processing PDF {pdf_path}: {e!s}")
+
+        log_document_processing_complete(
+            context=context,
+            chunks_created=chunks_created,
+            processing_time_seconds=time.time() - start_time,
+            status="success" if chunks_created else "success_empty",
+        )
+
+    def pdf_to_documents_recursive_md(
+        self,
+        pdf_path: Path,
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+    ) -> list[Document]:
+        """
+        Convert a PDF to markdown with PyMuPDF4LLM and split it into chunks.
+
+        The markdown keeps real paragraph breaks and headings, so the recursive
+        splitter can cut on "\\n\\n" instead of falling back to spaces. OCR
+        fallback is not applied on this path.
+
+        Args:
+            pdf_path: Path to the PDF file
+            chunk_size: Maximum size of each text chunk
+            chunk_overlap: Number of characters to overlap between chunks
+
+        Returns:
+            List of LangChain Document objects with content and metadata
+
+        Raises:
+            ImportError: If pymupdf4llm is not installed
+        """
+        if not MARKDOWN_EXTRACTION_AVAILABLE:
+            raise ImportError(
+                "pymupdf4llm is required for markdown extraction. "
+                "Install mcp-rag[markdown] to enable it."
+            )
+
+        self.validate_file(pdf_path)
+        start_time = time.time()
+        chunk_size, chunk_overlap = self.get_processing_params(
+            chunk_size, chunk_overlap
+        )
+
+        file_size = pdf_path.stat().st_size if pdf_path.exists() else 0
+        context = log_document_processing_start(
+            processor_name=self.processor_name,
+            file_path=str(pdf_path),
+            file_size=file_size,
+            file_type=pdf_path.suffix,
+        )
+
+        try:
+            markdown = pymupdf4llm.to_markdown(str(pdf_path))
+            documents = []
+            if markdown.strip():
+                text_splitter = self._get_text_splitter(chunk_size, chunk_overlap)
+                documents = text_splitter.split_documents(
+                    [Document(page_content=markdown, metadata={"source": str(pdf_path)})]
+                )
+
+            base_metadata = self._chunk_base_metadata(
+                pdf_path, chunk_size, chunk_overlap
+            )
+            base_metadata.update(
+                {
+                    "splitting_method": "recursive_md",
+                    "total_chunks": len(documents),
+                    "loader_type": "PyMuPDF4LLM",
+                }
+            )
+            for i, doc in enumerate(documents):
+                doc.metadata.update(base_metadata)
+                doc.metadata["chunk_id"] = f"chunk_{i}"
+
+            log_document_processing_complete(
+                context=context,
+                chunks_created=len(documents),
+                processing_time_seconds=time.time() - start_time,
+                status="success" if documents else "success_empty",
+            )
+            return documents
+
+        except Exception as e:
+            log_processing_error(
+                context=context, error=e, error_type="pdf_processing_error"
+            )
+            raise Exception(f"Error processing PDF {pdf_path}: {e!s}")
+
+    def _chunk_base_metadata(
+        self, pdf_path: Path, chunk_size: int, chunk_overlap: int
+    ) -> dict[str, Any]:
+        """Build the metadata shared by every chunk of a PDF, minus chunk_id."""
+        base_metadata = self.get_metadata_template(pdf_path)
+        base_metadata.update(
+            {
+                "document_id": f"{pdf_path.stem}_pdf",
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "splitting_method": self.splitting_method,
+                "loader_type": "PyMuPDF_OCR",
+            }
+        )
+        return base_metadata
+
+    def _chunk_cache_path(
+        self,
+        pdf_path: Path,
+        chunk_size: int,
+        chunk_overlap: int,
+        page_limit: int | None = None,
+    ) -> Path:
+        """
+        Return the cache file for this PDF's content and chunking parameters.
+
+        The key also covers the cache format version and whether OCR is
+        available, since either changes the chunks a parse would produce.
+        """
+        with open(pdf_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        extraction = "ocr" if OCR_AVAILABLE else "text"
+        key = (
+            f"v{CHUNK_CACHE_VERSION}_{extraction}_{digest}"
+            f"_{chunk_size}_{chunk_overlap}_{self.splitting_method}"
+        )
+        if page_limit is not None:
+            key += f"_p{page_limit}"
+        return self.cache_dir / f"{key}.jsonl"
+
+    def _read_chunk_cache(self, cache_path: Path) -> list[Document] | None:
+        """Load cached chunks, or return None when the cache is missing or unreadable."""
+        if not cache_path.exists():
+            return None
+        try:
+            rows = [
+                _json_loads(line)
+                for line in cache_path.read_bytes().splitlines()
+                if line.strip()
+            ]
+            return [
+                Document(page_content=page_content, metadata=ChunkMeta(*meta).as_dict())
+                for page_content, meta in rows
+            ]
+        except (OSError, ValueError, TypeError) as e:
+            # orjson.JSONDecodeError subclasses ValueError
+            logger.warning(f"Ignoring unreadable chunk cache {cache_path}: {e}")
+            return None
+
+    def _write_chunk_cache(self, cache_path: Path, documents: list[Document]) -> None:
+        """
+        Persist chunks as JSON lines; cache failures never fail processing.
+
+        Each line is [page_content, ChunkMeta row], so the metadata keys are
+        not repeated per chunk.
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            lines = [
+                _json_dumps_bytes(
+                    [doc.page_content, ChunkMeta(**doc.metadata).as_row()]
+                )
+                for doc in documents
+            ]
+            cache_path.write_bytes(b"\n".join(lines) + b"\n")
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write chunk cache {cache_path}: {e}")
+
+    def _iter_pdf_chunks(
+        self,
+        pdf_path: Path,
+        chunk_size: int,
+        chunk_overlap: int,
+        page_limit: int | None = None,
+    ) -> Iterator[Document]:
+        """Split each extracted page as soon as it is read and yield raw chunks."""
+        if self.use_rust_splitter:
+            rust_splitter = self._get_rust_splitter(chunk_size, chunk_overlap)
+            for page_doc in self._iter_pdf_pages(pdf_path, page_limit):
+                for text in rust_splitter.chunks(page_doc.page_content):
+                    yield Document(page_content=text, metadata=dict(page_doc.metadata))
+            return
+
+        text_splitter = self._get_text_splitter(chunk_size, chunk_overlap)
+        for page_doc in self._iter_pdf_pages(pdf_path, page_limit):
+            yield from text_splitter.split_documents([page_doc])
+
+    def _get_text_splitter(
+        self, chunk_size: int, chunk_overlap: int
+    ) -> RecursiveCharacterTextSplitter:
+        """Return the cached text splitter for the given chunking parameters."""
+        key = (chunk_size, chunk_overlap)
+        splitter = self._splitter_cache.get(key)
+        if splitter is None:
+            # Initialize the text splitter with optimized parameters
+            splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=["\n\n", "\n", " ", ""],
+            )
+            self._splitter_cache[key] = splitter
+        return splitter
+
+    def _get_rust_splitter(self, chunk_size: int, chunk_overlap: int) -> "TextSplitter":
+        """Return the cached semantic-text-splitter for the given parameters."""
+        key = (chunk_size, chunk_overlap)
+        splitter = self._rust_splitter_cache.get(key)
+        if splitter is None:
+            splitter = TextSplitter(chunk_size, overlap=chunk_overlap)
+            self._rust_splitter_cache[key] = splitter
+        return splitter
+
+    def _iter_pdf_pages(
+        self, pdf_path: Path, page_limit: int | None = None
+    ) -> Iterator[Document]:
+        """Yield a Document per PDF page that has text, with OCR fallback."""
+        # Stringify the path once; it is reused for every page
+        source_str = str(pdf_path)
+        # Use PyMuPDF for OCR-capable PDF processing
+        doc = fitz.open(source_str)
+        try:
             # Extract text from each page with OCR fallback
-            pages = []
-            for page_num in range(doc.page_count):
+            page_count = doc.page_count
+            if page_limit is not None:
+                page_count = min(page_count, page_limit)
+            for page_num in range(page_count):
                 page = doc[page_num]
-                
+
                 # Try to extract text normally first
                 text = page.get_text()
                 extraction_method = "pymupdf_text"
-                
+
                 # If no text found or very little text, try OCR
                 if not text.strip() or len(text.strip()) < 50:
                     logger.info(f"Page {page_num + 1} has minimal text ({len(text.strip())} chars), attempting enhanced extraction")
-                    
+
                     # Try different PyMuPDF extraction methods first
                     if not text.strip():
                         # Try extracting from text blocks
@@ -144,87 +774,31 @@ class PDFProcessor(DocumentProcessor):
                         text = "\n".join([block[4] for block in blocks if len(block) > 4])
                         if text.strip():
                             extraction_method = "pymupdf_blocks"
-                    
+
                     # If still no text and OCR is available, perform true OCR
                     if (not text.strip() or len(text.strip()) < 50) and OCR_AVAILABLE:
                         logger.info(f"Performing Tesseract OCR on page {page_num + 1}")
-                        ocr_text = self._perform_ocr_on_page(page, page_num + 1, str(pdf_path))
+                        ocr_text = self._perform_ocr_on_page(page, page_num + 1, source_str)
                         if ocr_text and len(ocr_text.strip()) > len(text.strip()):
                             text = ocr_text
                             extraction_method = "tesseract_ocr"
-                    
+
                     elif not text.strip() and not OCR_AVAILABLE:
                         logger.warning(f"Page {page_num + 1} has no text and OCR not available. Install pytesseract and Tesseract for image OCR.")
-                
+
                 if text.strip():
                     # Create Document object for this page
-                    page_doc = Document(
+                    yield Document(
                         page_content=text,
                         metadata={
                             "page": page_num + 1,
-                            "source": str(pdf_path),
+                            "source": source_str,
                             "extraction_method": extraction_method
                         }
                     )
-                    pages.append(page_doc)
-            
+        finally:
             doc.close()
 
-            if not pages:
-                log_document_processing_complete(
-                    context=context,
-                    chunks_created=0,
-                    processing_time_seconds=time.time() - start_time,
-                    status="success_empty",
-                )
-                return []
-
-            # Initialize the text splitter with optimized parameters
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                length_function=len,
-                separators=["\n\n", "\n", " ", ""],
-            )
-
-            # Split documents and enhance metadata
-            documents = text_splitter.split_documents(pages)
-
-            # Enhance metadata with processing information
-            base_metadata = self.get_metadata_template(pdf_path)
-            for i, doc in enumerate(documents):
-                # Preserve original page metadata and add our enhancements
-                doc.metadata.update(base_metadata)
-                doc.metadata.update(
-                    {
-                        "chunk_id": f"chunk_{i}",
-                        "document_id": f"{pdf_path.stem}_pdf",
-                        "chunk_size": chunk_size,
-                        "chunk_overlap": chunk_overlap,
-                        "splitting_method": "RecursiveCharacterTextSplitter",
-                        "total_chunks": len(documents),
-                        "loader_type": "PyMuPDF_OCR"
-                    }
-                )
-
-            # Log successful completion
-            processing_time = time.time() - start_time
-            log_document_processing_complete(
-                context=context,
-                chunks_created=len(documents),
-                processing_time_seconds=processing_time,
-                status="success",
-            )
-
-            return documents
-
-        except Exception as e:
-            # Log error
-            log_processing_error(
-                context=context, error=e, error_type="pdf_processing_error"
-            )
-            raise Exception(f"Error processing PDF {pdf_path}: {e!s}")
-
     def _perform_ocr_on_page(self, page, page_num: int, pdf_path: str) -> str:
         """
         Perform Tesseract OCR on a PDF page.
@@ -241,6 +815,9 @@ class PDFProcessor(DocumentProcessor):
             return ""
             
         try:
+            import pytesseract
+            from PIL import Image
+
             # Convert page to image (300 DPI for good OCR quality)
             pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))  # 2x scaling = ~300 DPI
             img_data = pix.pil_tobytes(format="PNG")
@@ -327,7 +904,11 @@ class PDFProcessor(DocumentProcessor):
 
     # Legacy method for backward compatibility
     def pdf_to_documents_recursive(
-        self, pdf_path: Path, chunk_size: int = None, chunk_overlap: int = None
+        self,
+        pdf_path: Path,
+        chunk_size: int = None,
+        chunk_overlap: int = None,
+        page_limit: int | None = None,
     ) -> list[Document]:
         """
         Convert PDF file to LangChain Document objects using RecursiveCharacterTextSplitter.
@@ -337,9 +918,12 @@ class PDFProcessor(DocumentProcessor):
             pdf_path: Path to the PDF file
             chunk_size: Maximum size of each text chunk (defaults to optimized PDF chunk size)
             chunk_overlap: Number of characters to overlap between chunks (defaults to optimized overlap)
+            page_limit: Only process the first N pages (defaults to all pages)
 
         Returns:
             List of LangChain Document objects
         """
         # Delegate to the new interface method
-        return self.process_document(pdf_path, chunk_size, chunk_overlap)
+        return self.process_document(
+            pdf_path, chunk_size, chunk_overlap, page_limit=page_limit
+        )
@@ -1,6 +1,19 @@
+import asyncio
+import importlib
 import os
 
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import nullcontext
 from enum import Enum
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
 import chromadb
@@ -8,20 +21,18 @@ from dotenv import load_dotenv
 from langchain.schema import Document
 from langchain.text_splitter import CharacterTextSplitter
 from langchain_chroma import Chroma
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain_openai import OpenAIEmbeddings
 
 try:
-    from .document_processor import ProcessorRegistry
+    from .document_processor import DocumentProcessor, ProcessorRegistry
     from .logging_config import get_logger
-    from .pdf_processor import PDFProcessor
+    from .pdf_processor import PROCESS_POOL_CONTEXT, PDFProcessor, get_pdf_process_pool
     from .text_processor import TextProcessor
     from .word_processor import WordProcessor
 except ImportError:
     # Fallback for direct execution
-    from document_processor import ProcessorRegistry
+    from document_processor import DocumentProcessor, ProcessorRegistry
     from logging_config import get_logger
-    from pdf_processor import PDFProcessor
+    from pdf_processor import PROCESS_POOL_CONTEXT, PDFProcessor, get_pdf_process_pool
     from text_processor import TextProcessor
     from word_processor import WordProcessor
 
@@ -44,7 +55,21 @@ DATA_DIR = PROJECT_ROOT / "data"
 CHROMADB_HOST = os.getenv("CHROMADB_HOST", "localhost")
 CHROMADB_PORT = int(os.getenv("CHROMADB_PORT", "8000"))
 CHROMADB_URL = f"http://{CHROMADB_HOST}:{CHROMADB_PORT}"
-DEFAULT_COLLECTION_NAME = os.getenv("CHROMADB_COLLECTION_NAME", "rag-kb")
+
+
+def get_default_collection_name() -> str:
+    """Return the collection name from CHROMADB_COLLECTION_NAME, read at call time."""
+    return os.getenv("CHROMADB_COLLECTION_NAME", "rag-kb")
+
+
+# Snapshot taken at import time, kept for backward compatibility
+DEFAULT_COLLECTION_NAME = get_default_collection_name()
+
+# Number of documents handed to the vectorstore per add call when streaming
+# or storing concurrently. The embedding SDKs already batch requests
+# internally (Google at 100 texts, OpenAI at chunk_size=1000), so this is a
+# multiple of both and adds no embedding round trips.
+EMBEDDING_BATCH_SIZE = 1000
 
 
 class ModelVendor(Enum):
@@ -52,10 +77,14 @@ class ModelVendor(Enum):
     GOOGLE = "google"
 
 
+@lru_cache(maxsize=1)
 def get_document_processor_registry() -> ProcessorRegistry:
     """
     Initialize and return a document processor registry with all supported processors.
 
+    The registry is built once per process and shared by every caller; use
+    get_document_processor_registry.cache_clear() to force a rebuild.
+
     Returns:
         ProcessorRegistry configured with PDF, Text, and Word processors
     """
@@ -69,67 +98,184 @@ def get_document_processor_registry() -> ProcessorRegistry:
     return registry
 
 
-def process_documents_from_directory(directory_path: Path) -> list[Document]:
+def _process_file_safely(
+    processor: DocumentProcessor | None, file_path: Path
+) -> list[Document]:
     """
-    Process all supported documents from directory using the processor registry.
+    Process a single file, logging and swallowing any processing error.
+
+    Module-level so it can be sent to a process pool together with the
+    (picklable) processor.
+
+    Args:
+        processor: Processor resolved for the file, or None if unsupported
+        file_path: Path to the file
+
+    Returns:
+        List of processed Document objects (empty on failure)
+    """
+    try:
+        if not processor:
+            logger.warning(
+                "No processor found for file",
+                file_name=file_path.name,
+                file_extension=file_path.suffix,
+            )
+            return []
+
+        logger.info(
+            "Processing document",
+            file_type=processor.file_type_description,
+            file_name=file_path.name,
+            processor_name=processor.processor_name,
+        )
+        docs = processor.process_document(file_path)
+        logger.info(
+            "Document processed successfully",
+            file_name=file_path.name,
+            chunks_extracted=len(docs),
+            processor_name=processor.processor_name,
+        )
+        return docs
+    except Exception as e:
+        logger.error(
+            "Error processing document",
+            file_name=file_path.name,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return []
+
+
+def _list_supported_files(
+    directory_path: Path, supported_extensions: frozenset[str]
+) -> list[Path]:
+    """
+    List the files in directory whose extension has a registered processor.
 
     Args:
         directory_path: Path to directory containing documents
+        supported_extensions: Lower-case extensions to keep
 
     Returns:
-        List of processed Document objects
+        Paths of the matching files, in directory order
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
     """
     directory = Path(directory_path)
     if not directory.exists():
         raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-    registry = get_document_processor_registry()
-    supported_extensions = registry.get_supported_extensions()
+    # Single scandir pass; DirEntry caches the file type from readdir, so
+    # there is no per-file stat()
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in supported_extensions
+        ]
 
-    all_documents = []
-
-    # Process all files with supported extensions
-    for file_path in directory.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-            try:
-                processor = registry.get_processor_for_file(file_path)
-                if processor:
-                    logger.info(
-                        "Processing document",
-                        file_type=processor.file_type_description,
-                        file_name=file_path.name,
-                        processor_name=processor.processor_name,
-                    )
-                    docs = registry.process_document(file_path)
-                    all_documents.extend(docs)
-                    logger.info(
-                        "Document processed successfully",
-                        file_name=file_path.name,
-                        chunks_extracted=len(docs),
-                        processor_name=processor.processor_name,
-                    )
-                else:
-                    logger.warning(
-                        "No processor found for file",
-                        file_name=file_path.name,
-                        file_extension=file_path.suffix,
-                    )
-            except Exception as e:
-                logger.error(
-                    "Error processing document",
-                    file_name=file_path.name,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
 
-    if not all_documents:
+def _runs_in_thread(processor: DocumentProcessor | None) -> bool:
+    """Return whether a file handled by processor may run in a worker thread."""
+    return processor is None or processor.io_bound
+
+
+def iter_documents_from_directory(
+    directory_path: Path, max_workers: int | None = None
+) -> Iterator[Document]:
+    """
+    Lazily yield documents from directory using the processor registry.
+
+    Files with an I/O-bound processor are processed concurrently in a thread
+    pool. CPU-bound processors such as PDFProcessor (PyMuPDF is not
+    thread-safe) run sequentially in the calling thread; use
+    process_pdf_files() or PDFProcessor.process_many() to spread PDFs over a
+    process pool. Documents are yielded in directory order regardless of
+    which file finishes first, and a file that fails to process contributes
+    no documents. At most max_workers files are processed ahead of the
+    caller, so callers that consume the iterator incrementally only keep a
+    bounded number of unhandled chunks in memory.
+
+    Args:
+        directory_path: Path to directory containing documents
+        max_workers: Number of worker threads for I/O-bound files (defaults
+            to min(32, cpu_count * 4)); 1 processes the files sequentially
+
+    Yields:
+        Processed Document objects
+
+    Raises:
+        FileNotFoundError: If the directory does not exist (on first
+            iteration)
+    """
+    registry = get_document_processor_registry()
+    supported_extensions = registry.get_supported_extensions()
+    file_paths = _list_supported_files(directory_path, supported_extensions)
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    # Resolve each file's processor once; it decides where the file runs
+    # and then processes it
+    jobs = [(path, registry.get_processor_for_file(path)) for path in file_paths]
+    threaded_count = sum(1 for _, processor in jobs if _runs_in_thread(processor))
+    sequential = max_workers <= 1 or not threaded_count
+    document_count = 0
+    with (
+        nullcontext()
+        if sequential
+        else ThreadPoolExecutor(max_workers=min(max_workers, threaded_count))
+    ) as executor:
+
+        def start(job: tuple[Path, DocumentProcessor | None]) -> Future | tuple:
+            path, processor = job
+            if executor and _runs_in_thread(processor):
+                return executor.submit(_process_file_safely, processor, path)
+            return job  # Processed in this thread once it reaches the front
+
+        # At most max_workers files are in flight ahead of the caller; the
+        # next one is started only as a finished file is handed over
+        remaining = iter(jobs)
+        window = deque(map(start, islice(remaining, max(max_workers, 1))))
+        while window:
+            head = window.popleft()
+            if isinstance(head, Future):
+                documents = head.result()
+            else:
+                path, processor = head
+                documents = _process_file_safely(processor, path)
+            window.extend(map(start, islice(remaining, 1)))
+            document_count += len(documents)
+            yield from documents
+
+    if not document_count:
         logger.warning(
             "No supported documents found",
             directory_path=str(directory_path),
             supported_extensions=sorted(supported_extensions),
         )
 
-    return all_documents
+
+def process_documents_from_directory(
+    directory_path: Path, max_workers: int | None = None
+) -> list[Document]:
+    """
+    Process all supported documents from directory using the processor registry.
+
+    Materializing wrapper around iter_documents_from_directory().
+
+    Args:
+        directory_path: Path to directory containing documents
+        max_workers: Number of worker threads for I/O-bound files (defaults to
+            min(32, cpu_count * 4)); 1 processes the files sequentially
+
+    Returns:
+        List of processed Document objects
+    """
+    return list(iter_documents_from_directory(directory_path, max_workers))
 
 
 # Legacy functions for backward compatibility
@@ -164,30 +310,67 @@ def process_text_files(directory_path: Path) -> list[Document]:
     return documents
 
 
-def process_pdf_files(directory_path: Path) -> list[Document]:
-    """Process all .pdf files in directory (legacy function)."""
-    documents = []
+def _process_pdf_file(pdf_file: Path) -> list[Document]:
+    """
+    Process one PDF file for process_pdf_files (module-level so it pickles).
+
+    Args:
+        pdf_file: Path to the PDF file
+
+    Returns:
+        List of Document objects (empty on failure)
+    """
     registry = get_document_processor_registry()
+    try:
+        logger.info("Processing legacy PDF file", file_name=pdf_file.name)
+        docs = registry.process_document(pdf_file)
+        logger.info(
+            "Legacy PDF file processed",
+            file_name=pdf_file.name,
+            chunks_extracted=len(docs),
+            splitting_method="RecursiveCharacterTextSplitter",
+        )
+        return docs
+    except Exception as e:
+        logger.error(
+            "Error processing legacy PDF file",
+            file_name=pdf_file.name,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return []
 
-    for pdf_file in directory_path.glob("*.pdf"):
-        try:
-            logger.info("Processing legacy PDF file", file_name=pdf_file.name)
-            docs = registry.process_document(pdf_file)
-            documents.extend(docs)
-            logger.info(
-                "Legacy PDF file processed",
-                file_name=pdf_file.name,
-                chunks_extracted=len(docs),
-                splitting_method="RecursiveCharacterTextSplitter",
-            )
-        except Exception as e:
-            logger.error(
-                "Error processing legacy PDF file",
-                file_name=pdf_file.name,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-    return documents
+
+def process_pdf_files(
+    directory_path: Path, num_workers: int | None = None
+) -> list[Document]:
+    """
+    Process all .pdf files in directory (legacy function).
+
+    PDF parsing is CPU-bound, so multiple files are spread across a process
+    pool. Documents are returned in glob order.
+
+    Args:
+        directory_path: Path to directory containing PDF files
+        num_workers: Number of worker processes (defaults to min(cpu_count, 4));
+            1 processes the files sequentially in the current process
+
+    Returns:
+        List of Document objects from all PDF files
+    """
+    pdf_files = list(directory_path.glob("*.pdf"))
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 1, 4)
+
+    if num_workers <= 1 or len(pdf_files) <= 1:
+        results = map(_process_pdf_file, pdf_files)
+        return list(chain.from_iterable(results))
+
+    with ProcessPoolExecutor(
+        max_workers=min(num_workers, len(pdf_files)), mp_context=PROCESS_POOL_CONTEXT
+    ) as executor:
+        results = executor.map(_process_pdf_file, pdf_files)
+        return list(chain.from_iterable(results))
 
 
 def load_documents_from_directory(directory_path: Path) -> list[Document]:
@@ -236,24 +419,47 @@ def ensure_data_directory(model_vendor: ModelVendor) -> Path:
     return db_path
 
 
+# Embedding provider SDKs take about a second to import, so they are loaded
+# on first use and then cached as module attributes
+_LAZY_EMBEDDING_CLASSES = {
+    "GoogleGenerativeAIEmbeddings": "langchain_google_genai",
+    "OpenAIEmbeddings": "langchain_openai",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EMBEDDING_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _embedding_class(name: str):
+    """Return an embedding class, honouring any module-level override."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
 def load_embedding_model(model_vendor: ModelVendor):
     """Load the embedding model based on the vendor."""
     if model_vendor == ModelVendor.OPENAI:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
-        return OpenAIEmbeddings(openai_api_key=api_key)
+        return _embedding_class("OpenAIEmbeddings")(openai_api_key=api_key)
     if model_vendor == ModelVendor.GOOGLE:
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("GOOGLE_API_KEY environment variable is required")
-        return GoogleGenerativeAIEmbeddings(
+        return _embedding_class("GoogleGenerativeAIEmbeddings")(
             model="models/text-embedding-004", google_api_key=api_key
         )
 
 
+@lru_cache(maxsize=1)
 def get_text_splitter():
-    """Get optimized text splitter for mixed factual content."""
+    """Get the shared text splitter for mixed factual content (built once)."""
     return CharacterTextSplitter(
         separator="\n",
         chunk_size=300,  # Increased from 200 for better context
@@ -261,14 +467,23 @@ def get_text_splitter():
     )
 
 
+def _batches(items: list, batch_size: int) -> list[list]:
+    """Split items into consecutive batches of at most batch_size."""
+    return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+
 def store_to_chroma(documents: list[Document], model_vendor: ModelVendor, collection_name: str = None) -> Chroma:
     """
     Store documents to ChromaDB server.
+
+    Documents go to Chroma in a single from_documents call; the embedding
+    SDKs split the texts into request-sized batches themselves.
     
     Args:
         documents: List of documents to store
         model_vendor: Which embedding model to use
-        collection_name: Collection name to use (defaults to 'langchain')
+        collection_name: Collection name to use (defaults to
+            get_default_collection_name())
         
     Returns:
         Chroma vectorstore instance connected to ChromaDB server
@@ -281,7 +496,7 @@ def store_to_chroma(documents: list[Document], model_vendor: ModelVendor, collec
     embedding_model = load_embedding_model(model_vendor)
     
     # Use default collection name if not specified
-    collection_name = collection_name or DEFAULT_COLLECTION_NAME
+    collection_name = collection_name or get_default_collection_name()
     
     # Create vectorstore with HTTP client
     vectorstore = Chroma.from_documents(
@@ -301,18 +516,151 @@ def store_to_chroma(documents: list[Document], model_vendor: ModelVendor, collec
     return vectorstore
 
 
-def main():
-    """Store documents (text and PDF) to ChromaDB using Google embeddings."""
+async def _gather_in_threads(func, batches: list, concurrency: int) -> list:
+    """Run func over each batch in worker threads, at most `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(batch):
+        async with semaphore:
+            return await asyncio.to_thread(func, batch)
+
+    return await asyncio.gather(*(run(batch) for batch in batches))
+
+
+async def aprocess_documents_from_directory(
+    directory_path: Path, concurrency: int = 16, executor: Executor | None = None
+) -> list[Document]:
+    """
+    Async variant of process_documents_from_directory.
+
+    Files with an I/O-bound processor are processed in worker threads with
+    at most `concurrency` files in flight, so they overlap without blocking
+    the event loop. The speedup applies only to such I/O-bound loaders:
+    CPU-bound processors such as PDFProcessor run in a process pool instead.
+    Documents are returned in directory order and a file that fails to
+    process contributes no documents.
+
+    Args:
+        directory_path: Path to directory containing documents
+        concurrency: Maximum number of I/O-bound files processed at the same
+            time
+        executor: Process pool for CPU-bound files (defaults to
+            get_pdf_process_pool())
+
+    Returns:
+        List of processed Document objects
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    registry = get_document_processor_registry()
+    supported_extensions = registry.get_supported_extensions()
+    file_paths = await asyncio.to_thread(
+        _list_supported_files, directory_path, supported_extensions
+    )
+
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def run(path: Path) -> list[Document]:
+        processor = registry.get_processor_for_file(path)
+        if not _runs_in_thread(processor):
+            # The pool queues the work itself; a long-lived pool also means
+            # cancelling never waits on a shutdown
+            return await loop.run_in_executor(
+                executor or get_pdf_process_pool(),
+                _process_file_safely,
+                processor,
+                path,
+            )
+        async with semaphore:
+            return await asyncio.to_thread(_process_file_safely, processor, path)
+
+    results = await asyncio.gather(*(run(path) for path in file_paths))
+    all_documents = list(chain.from_iterable(results))
+
+    if not all_documents:
+        logger.warning(
+            "No supported documents found",
+            directory_path=str(directory_path),
+            supported_extensions=sorted(supported_extensions),
+        )
+
+    return all_documents
+
+
+async def astore_to_chroma(
+    documents: list[Document],
+    model_vendor: ModelVendor,
+    collection_name: str | None = None,
+    concurrency: int = 8,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+) -> Chroma:
+    """
+    Async variant of store_to_chroma that embeds batches concurrently.
+
+    Documents are added to the collection in batches from worker threads,
+    so several embedding requests are in flight at once instead of one
+    request for the whole corpus.
+
+    Args:
+        documents: List of documents to store
+        model_vendor: Which embedding model to use
+        collection_name: Collection name to use (defaults to
+            get_default_collection_name())
+        concurrency: Maximum number of batches stored at the same time
+        batch_size: Number of documents per batch
+
+    Returns:
+        Chroma vectorstore instance connected to ChromaDB server
+
+    Raises:
+        ConnectionError: If cannot connect to ChromaDB server
+    """
+    client = await asyncio.to_thread(get_chromadb_client)
+    # The first load imports the embedding SDK, which takes about a second
+    embedding_model = await asyncio.to_thread(load_embedding_model, model_vendor)
+    collection_name = collection_name or get_default_collection_name()
+
+    vectorstore = Chroma(
+        client=client,
+        collection_name=collection_name,
+        embedding_function=embedding_model,
+    )
+    batches = _batches(documents, batch_size)
+    await _gather_in_threads(vectorstore.add_documents, batches, concurrency)
+
+    logger.info(
+        "Documents stored to ChromaDB server",
+        documents_count=len(documents),
+        server_url=CHROMADB_URL,
+        collection_name=collection_name,
+        model_vendor=model_vendor.value,
+        batches=len(batches),
+    )
+    return vectorstore
+
+
+def main(data_source_dir: Path | None = None):
+    """
+    Store documents (text and PDF) to ChromaDB using Google embeddings.
+
+    Args:
+        data_source_dir: Directory to load documents from (defaults to the
+            data_source directory next to this module)
+    """
     logger.info("Starting document embedding storage process")
 
     # Use the new unified document processing
-    # Look for data_source in the rag_store directory
-    data_source_dir = Path(__file__).parent / "data_source"
+    # Look for data_source in the rag_store directory by default
+    if data_source_dir is None:
+        data_source_dir = Path(__file__).parent / "data_source"
 
     try:
-        all_documents = process_documents_from_directory(data_source_dir)
+        documents = iter_documents_from_directory(data_source_dir)
+        batch = list(islice(documents, EMBEDDING_BATCH_SIZE))
 
-        if not all_documents:
+        if not batch:
             registry = get_document_processor_registry()
             supported_formats = [
                 processor.file_type_description
@@ -324,12 +672,6 @@ def main():
                 supported_formats=supported_formats,
             )
             return
-
-        logger.info(
-            "Documents loaded successfully",
-            total_documents=len(all_documents),
-            data_source_dir=str(data_source_dir),
-        )
     except Exception as e:
         logger.error(
             "Error loading documents",
@@ -339,13 +681,20 @@ def main():
         )
         return
 
-    # Store documents using Google embeddings
-    vectorstore = store_to_chroma(all_documents, ModelVendor.GOOGLE)
+    # Store documents using Google embeddings, one batch at a time so only
+    # the batch being embedded is held in memory
+    vectorstore = store_to_chroma(batch, ModelVendor.GOOGLE)
+    total_documents = len(batch)
+    while batch := list(islice(documents, EMBEDDING_BATCH_SIZE)):
+        vectorstore.add_documents(batch)
+        total_documents += len(batch)
+
     logger.info(
         "Document storage completed successfully",
         server_url=CHROMADB_URL,
         model_vendor="google",
-        total_documents=len(all_documents),
+        total_documents=total_documents,
+        data_source_dir=str(data_source_dir),
     )
 
     # Test the storage by doing a quick search
@@ -6,15 +6,10 @@ service.
 """
 
 import io
-import sys
 import tempfile
 import unittest
-from pathlib import Path
 from unittest.mock import patch
 
-# Add src to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from rag_fetch.cli import main
 
 
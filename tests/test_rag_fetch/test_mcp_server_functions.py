@@ -10,7 +10,7 @@ import json
 import signal
 import sys
 import unittest
-from unittest.mock import Mock, patch, MagicMock, call, AsyncMock
+from unittest.mock import Mock, patch, call, AsyncMock
 from unittest import TestCase
 
 # Import the module under test
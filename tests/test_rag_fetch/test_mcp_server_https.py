@@ -10,7 +10,7 @@ import tempfile
 import threading
 import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, patch
 import requests
 
 from rag_fetch.config import ServerConfig
@@ -230,7 +230,7 @@ class TestSSLEnvironmentModes:
             'MCP_SSL_VERIFY_MODE': 'strict'
         }):
             with patch('rag_fetch.config.logging.getLogger') as mock_logger:
-                mock_log = MagicMock()
+                mock_log = Mock()
                 mock_logger.return_value = mock_log
                 
                 config = ServerConfig()
@@ -9,13 +9,10 @@ import os
 import time
 
 # Import the module to test
-import sys
 import unittest
 
-from pathlib import Path
 from unittest.mock import Mock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from rag_fetch.search_similarity import (
     ModelVendor,
     get_cached_vectorstore,
@@ -6,7 +6,7 @@ import os
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, patch
 
 from rag_fetch.config import ServerConfig, TransportType
 
@@ -331,7 +331,7 @@ class TestSSLCertificateValidation:
     @patch('rag_fetch.config.logging.getLogger')
     def test_self_signed_certificate_production_warning(self, mock_logger):
         """Test self-signed certificate generates warning in production."""
-        mock_log = MagicMock()
+        mock_log = Mock()
         mock_logger.return_value = mock_log
         
         config = ServerConfig()
@@ -362,8 +362,8 @@ class TestSSLCertificateValidation:
         with patch('cryptography.x509.load_pem_x509_certificate') as mock_load_cert:
             with patch('cryptography.hazmat.primitives.serialization.load_pem_private_key') as mock_load_key:
                 # Mock certificate and key that don't match
-                mock_cert = MagicMock()
-                mock_key = MagicMock()
+                mock_cert = Mock()
+                mock_key = Mock()
                 
                 # Different public key numbers to simulate mismatch
                 mock_cert.public_key.return_value.public_numbers.return_value = "cert_numbers"
@@ -387,7 +387,7 @@ class TestSSLCertificateValidation:
         with patch.dict('sys.modules', {'cryptography.x509': None, 'cryptography.hazmat.primitives': None}):
             with patch('builtins.__import__', side_effect=ImportError("cryptography not available")):
                 with patch('rag_fetch.config.logging.getLogger') as mock_logger:
-                    mock_log = MagicMock()
+                    mock_log = Mock()
                     mock_logger.return_value = mock_log
                     
                     config = ServerConfig()
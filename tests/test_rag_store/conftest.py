@@ -0,0 +1,11 @@
+"""
+Shared pytest fixtures for rag_store tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def work_dir(tmp_path):
+    """Empty per-test scratch directory; unique even across parametrized ids."""
+    return tmp_path
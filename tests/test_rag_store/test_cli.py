@@ -6,15 +6,10 @@ ingestion service.
 """
 
 import io
-import sys
 import tempfile
 import unittest
-from pathlib import Path
 from unittest.mock import patch
 
-# Add src to path for testing
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from rag_store.cli import main
 
 
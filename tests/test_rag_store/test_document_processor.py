@@ -8,14 +8,12 @@ the PDF and Text processor implementations.
 import shutil
 
 # Import the modules to test
-import sys
 import tempfile
 import unittest
 
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from rag_store.document_processor import DocumentProcessor, ProcessorRegistry
 from rag_store.pdf_processor import PDFProcessor
 from rag_store.text_processor import TextProcessor
@@ -49,6 +47,20 @@ class TestDocumentProcessorInterface(unittest.TestCase):
         expected_extensions = {".pdf", ".txt", ".md", ".text"}
         self.assertEqual(extensions, expected_extensions)
 
+    def test_supported_extensions_cached_until_registration(self):
+        """Test supported extensions are cached and refreshed on registration."""
+        registry = ProcessorRegistry()
+        registry.register_processor(PDFProcessor())
+
+        extensions = registry.get_supported_extensions()
+        self.assertIsInstance(extensions, frozenset)
+        self.assertIs(registry.get_supported_extensions(), extensions)
+
+        registry.register_processor(TextProcessor())
+        self.assertEqual(
+            registry.get_supported_extensions(), {".pdf", ".txt", ".md", ".text"}
+        )
+
     def test_processor_lookup_by_file(self):
         """Test finding processors by file extension."""
         registry = ProcessorRegistry()
@@ -4,544 +4,765 @@ Unit tests for store_embeddings module.
 This test suite covers the document storage and embedding functionality.
 """
 
+import asyncio
 import os
-import shutil
-
-# Import the module to test
-import pytest
+import subprocess
 import sys
-import tempfile
-import unittest
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+import fitz
+import pytest
+
+from langchain.schema import Document
+
+# Import the module to test
+from rag_store import store_embeddings as se
 from rag_store.store_embeddings import (
+    DEFAULT_COLLECTION_NAME,
     ModelVendor,
+    aprocess_documents_from_directory,
+    astore_to_chroma,
+    get_default_collection_name,
+    get_document_processor_registry,
     get_text_splitter,
-    load_embedding_model,
+    iter_documents_from_directory,
     load_txt_documents,
+    main,
     process_documents_from_directory,
     process_pdf_files,
     process_text_files,
+    store_to_chroma,
 )
 
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Only tests that resolve an SDK class need it installed; the module itself
+# imports the embedding SDKs lazily
+requires_google_sdk = pytest.mark.skipif(
+    find_spec("langchain_google_genai") is None,
+    reason="langchain-google-genai not installed",
+)
+requires_openai_sdk = pytest.mark.skipif(
+    find_spec("langchain_openai") is None,
+    reason="langchain-openai not installed",
+)
+
+
+@pytest.fixture(scope="module")
+def _registry_mock():
+    """Registry mock shared across the module; reset before every use."""
+    return Mock()
+
+
+@pytest.fixture
+def patch_registry(_registry_mock, monkeypatch):
+    """Make get_document_processor_registry return the shared, pre-configured registry mock."""
+    _registry_mock.reset_mock(return_value=True, side_effect=True)
+    _registry_mock.get_supported_extensions.return_value = {".pdf", ".txt", ".md"}
+    monkeypatch.setattr(se, "get_document_processor_registry", lambda: _registry_mock)
+    return _registry_mock
+
+
+@pytest.fixture
+def mock_processor(patch_registry):
+    """I/O-bound processor mock that the patched registry resolves for every file."""
+    processor = Mock(io_bound=True)
+    patch_registry.get_processor_for_file.return_value = processor
+    return processor
+
+
+def test_model_vendor_enum():
+    """Test ModelVendor enum values."""
+    assert ModelVendor.OPENAI.value == "openai"
+    assert ModelVendor.GOOGLE.value == "google"
+
+
+@requires_google_sdk
+@patch.object(se, "GoogleGenerativeAIEmbeddings")
+def test_load_embedding_model_google(mock_google_class, monkeypatch):
+    """Test loading Google embedding model."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test_key")
+
+    mock_model = Mock()
+    mock_google_class.return_value = mock_model
+
+    result = se.load_embedding_model(se.ModelVendor.GOOGLE)
+
+    mock_google_class.assert_called_once_with(
+        model="models/text-embedding-004", google_api_key="test_key"
+    )
+    assert result == mock_model
+
+
+@requires_openai_sdk
+@patch.object(se, "OpenAIEmbeddings")
+def test_load_embedding_model_openai(mock_openai_class, monkeypatch):
+    """Test loading OpenAI embedding model."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+
+    mock_model = Mock()
+    mock_openai_class.return_value = mock_model
+
+    result = se.load_embedding_model(se.ModelVendor.OPENAI)
+
+    mock_openai_class.assert_called_once_with(openai_api_key="test_key")
+    assert result == mock_model
+
+
+def test_get_document_processor_registry_is_cached():
+    """Test the processor registry is built once and reused."""
+    get_document_processor_registry.cache_clear()
+    registry = get_document_processor_registry()
+
+    assert get_document_processor_registry() is registry
+    assert {".pdf", ".txt", ".docx"} <= registry.get_supported_extensions()
+
+
+@requires_openai_sdk
+def test_import_defers_embedding_sdks():
+    """Test importing store_embeddings loads no embedding provider SDK until used."""
+    code = (
+        "import sys; import rag_store.store_embeddings as se; "
+        "sdks = ('langchain_openai', 'langchain_google_genai'); "
+        "print(sorted(m for m in sdks if m in sys.modules)); "
+        "se.OpenAIEmbeddings; "
+        "print(sorted(m for m in sdks if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+        check=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-2:] == ["[]", "['langchain_openai']"]
+
+
+def test_process_pdf_files_empty_directory(work_dir):
+    """Test processing PDF files from empty directory."""
+    # The per-test work_dir starts out empty
+    result = process_pdf_files(work_dir)
+
+    assert len(result) == 0
+    assert isinstance(result, list)
+
+
+def test_process_pdf_files_with_pdfs(patch_registry):
+    """Test processing PDF files from directory with PDFs."""
+    # Synthetic directory listing - no files need to exist on disk
+    directory = Mock(spec=Path)
+    directory.glob.return_value = [Path("test1.pdf"), Path("test2.pdf")]
+
+    # Mock processing result
+    patch_registry.process_document.return_value = [
+        SimpleNamespace(page_content="Test content", metadata={"source": "test1.pdf"})
+    ]
+
+    # Mocks don't cross process boundaries, so stay in-process
+    result = process_pdf_files(directory, num_workers=1)
+
+    # Should process both PDF files
+    directory.glob.assert_called_once_with("*.pdf")
+    assert patch_registry.process_document.call_count == 2
+    assert len(result) == 2  # 2 PDFs × 1 document each
+
+
+def test_process_pdf_files_process_pool(work_dir):
+    """Test process_pdf_files parses several PDFs in worker processes."""
+    for name in ("a.pdf", "b.pdf"):
+        pdf = fitz.open()
+        pdf.new_page().insert_text((72, 72), f"Content of {name}")
+        pdf.save(work_dir / name)
+        pdf.close()
+
+    result = process_pdf_files(work_dir, num_workers=2)
+
+    sources = [doc.metadata["source"] for doc in result]
+    assert sources == [p.name for p in work_dir.glob("*.pdf")]
+    assert "Content of a.pdf" in result[sources.index("a.pdf")].page_content
+
+
+def test_process_text_files_empty_directory(work_dir):
+    """Test processing text files from empty directory."""
+    # The per-test work_dir starts out empty
+    result = process_text_files(work_dir)
+
+    assert len(result) == 0
+    assert isinstance(result, list)
+
+
+def test_process_text_files_with_texts(patch_registry):
+    """Test processing text files from directory with text files."""
+    # Synthetic directory listing - no files need to exist on disk
+    directory = Mock(spec=Path)
+    directory.glob.return_value = [Path("test1.txt"), Path("test2.txt")]
+
+    # Mock processing result
+    patch_registry.process_document.return_value = [
+        SimpleNamespace(page_content="Test content", metadata={"source": "test.txt"})
+    ]
+
+    result = process_text_files(directory)
+
+    # Should process both text files
+    directory.glob.assert_called_once_with("*.txt")
+    assert patch_registry.process_document.call_count == 2
+    assert len(result) == 2  # 2 text files × 1 document each
+
+
+def test_process_documents_from_directory_unified(patch_registry, work_dir):
+    """Test the new unified document processing function."""
+    # Create mixed file types (the directory scan needs real entries here)
+    for name in ("test.pdf", "test.txt", "test.md", "test.xyz"):
+        (work_dir / name).touch()
+
+    # Mock processor selection
+    processor = Mock()
+    processor.process_document.return_value = [
+        SimpleNamespace(page_content="Test content", metadata={"source": "test.pdf"})
+    ]
+
+    def mock_get_processor(file_path):
+        if file_path.suffix in {".pdf", ".txt", ".md"}:
+            return processor
+        return None
+
+    patch_registry.get_processor_for_file.side_effect = mock_get_processor
+
+    result = process_documents_from_directory(work_dir)
+
+    # Should process 3 supported files (pdf, txt, md) but not xyz, resolving
+    # each file's processor exactly once
+    assert patch_registry.get_processor_for_file.call_count == 3
+    assert processor.process_document.call_count == 3
+    patch_registry.process_document.assert_not_called()
+    assert len(result) == 3  # 3 supported files × 1 document each
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_process_documents_from_directory_keeps_directory_order(
+    patch_registry, mock_processor, work_dir, max_workers
+):
+    """Test threaded processing returns documents in directory order."""
+    for i in range(8):
+        (work_dir / f"doc{i}.txt").touch()
+
+    patch_registry.get_supported_extensions.return_value = {".txt"}
+    mock_processor.process_document.side_effect = lambda path: [
+        SimpleNamespace(page_content=path.name, metadata={"source": path.name})
+    ]
+
+    result = process_documents_from_directory(work_dir, max_workers=max_workers)
+
+    assert [doc.page_content for doc in result] == [p.name for p in work_dir.iterdir()]
+
+
+def test_iter_documents_from_directory_bounds_files_in_flight(
+    patch_registry, mock_processor, work_dir
+):
+    """Test the thread pool stays at most max_workers files ahead of the caller."""
+    for i in range(10):
+        (work_dir / f"doc{i}.txt").touch()
+
+    patch_registry.get_supported_extensions.return_value = {".txt"}
+    started = []
+
+    def process_document(path):
+        started.append(path.name)
+        return [SimpleNamespace(page_content=path.name, metadata={})]
+
+    mock_processor.process_document.side_effect = process_document
+
+    consumed = 0
+    for _ in iter_documents_from_directory(work_dir, max_workers=2):
+        consumed += 1
+        time.sleep(0.02)  # Slow consumer: give the pool time to run ahead
+        assert len(started) <= consumed + 2
+
+    assert consumed == 10
+
+
+def test_process_documents_from_directory_keeps_pdfs_out_of_threads(
+    work_dir, monkeypatch
+):
+    """Test PDFs are parsed in the calling thread while text files use the pool."""
+    for name in ("a.pdf", "b.pdf"):
+        pdf = fitz.open()
+        pdf.new_page().insert_text((72, 72), f"Content of {name}")
+        pdf.save(work_dir / name)
+        pdf.close()
+    for name in ("c.txt", "d.txt"):
+        (work_dir / name).write_text(f"Content of {name}")
+
+    pdf_threads = []
+    real_open = fitz.open
+
+    def recording_open(*args, **kwargs):
+        pdf_threads.append(threading.get_ident())
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(fitz, "open", recording_open)
+
+    result = process_documents_from_directory(work_dir, max_workers=4)
+
+    assert set(pdf_threads) == {threading.get_ident()}
+    sources = [doc.metadata["source"] for doc in result]
+    assert list(dict.fromkeys(sources)) == [p.name for p in work_dir.iterdir()]
+    assert "Content of a.pdf" in result[sources.index("a.pdf")].page_content
+
+
+def test_process_documents_from_directory_no_processor_found(work_dir):
+    """Test process_documents_from_directory when no processor found for file."""
+    # Create a file with unsupported extension
+    unsupported_file = work_dir / "test.xyz"
+    unsupported_file.write_text("test content")
+
+    # Process should handle the unsupported file gracefully
+    documents = process_documents_from_directory(work_dir)
+
+    # Should return empty list since no processors support .xyz files
+    assert documents == []
+
+
+def test_process_documents_from_directory_processing_error(patch_registry, work_dir):
+    """Test process_documents_from_directory when document processing fails."""
+    # Create a text file
+    text_file = work_dir / "test.txt"
+    text_file.write_text("test content")
+
+    # Mock processor that raises exception
+    mock_processor = Mock()
+    mock_processor.file_type_description = "Text files"
+    mock_processor.processor_name = "TextProcessor"
+    mock_processor.process_document.side_effect = Exception("Processing failed")
+    patch_registry.get_processor_for_file.return_value = mock_processor
+    patch_registry.get_supported_extensions.return_value = {".txt"}
+
+    # Process should handle the exception gracefully
+    documents = process_documents_from_directory(work_dir)
+
+    # Should return empty list due to processing error
+    assert documents == []
+
+
+def test_process_documents_from_directory_empty_directory(work_dir):
+    """Test process_documents_from_directory with empty directory."""
+    # Test with empty directory
+    documents = process_documents_from_directory(work_dir)
+
+    # Should return empty list and log warning
+    assert documents == []
+
+
+def test_load_txt_documents_function(patch_registry, work_dir):
+    """Test the legacy load_txt_documents function."""
+    # Create a text file
+    text_file = work_dir / "test.txt"
+    text_file.write_text("test content")
+
+    # Mock successful processing
+    mock_doc = SimpleNamespace(page_content="test content", metadata={})
+    patch_registry.process_document.return_value = [mock_doc]
+
+    # Test the function
+    documents = load_txt_documents(text_file)
+
+    # Verify it uses the registry correctly
+    patch_registry.process_document.assert_called_once_with(text_file)
+    assert len(documents) == 1
+
+
+def test_load_embedding_model_missing_google_key(monkeypatch):
+    """Test load_embedding_model with missing GOOGLE_API_KEY."""
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
 
-class TestStoreEmbeddings(unittest.TestCase):
-    """Test cases for store_embeddings module."""
-
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_dir_path = Path(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up after each test method."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_model_vendor_enum(self):
-        """Test ModelVendor enum values."""
-        self.assertEqual(ModelVendor.OPENAI.value, "openai")
-        self.assertEqual(ModelVendor.GOOGLE.value, "google")
-
-    @unittest.skip("Environment isolation issue - .env loading at import time conflicts with test suite environment")
-    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test_key"}, clear=True)
-    @patch('rag_store.store_embeddings.GoogleGenerativeAIEmbeddings')
-    def test_load_embedding_model_google(self, mock_google_class):
-        """Test loading Google embedding model."""
-        mock_model = Mock()
-        mock_google_class.return_value = mock_model
-        
-        result = load_embedding_model(ModelVendor.GOOGLE)
-        
-        mock_google_class.assert_called_once_with(
-            model="models/text-embedding-004", google_api_key="test_key"
+    with pytest.raises(
+        ValueError, match="GOOGLE_API_KEY environment variable is required"
+    ):
+        se.load_embedding_model(se.ModelVendor.GOOGLE)
+
+
+def test_load_embedding_model_missing_openai_key(monkeypatch):
+    """Test load_embedding_model with missing OPENAI_API_KEY."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    with pytest.raises(
+        ValueError, match="OPENAI_API_KEY environment variable is required"
+    ):
+        se.load_embedding_model(se.ModelVendor.OPENAI)
+
+
+def test_get_text_splitter_function():
+    """Test the get_text_splitter function."""
+    splitter = get_text_splitter()
+
+    # Verify splitter configuration
+    assert splitter._chunk_size == 300
+    assert splitter._chunk_overlap == 50
+    assert splitter._separator == "\n"
+    assert get_text_splitter() is splitter
+
+
+@pytest.fixture
+def main_mocks(monkeypatch):
+    """Replace main()'s document source, storage and registry lookup with autospecced mocks."""
+    mocks = SimpleNamespace(
+        iter_documents=create_autospec(se.iter_documents_from_directory),
+        store_to_chroma=create_autospec(se.store_to_chroma),
+        get_registry=create_autospec(se.get_document_processor_registry),
+    )
+    monkeypatch.setattr(se, "iter_documents_from_directory", mocks.iter_documents)
+    monkeypatch.setattr(se, "store_to_chroma", mocks.store_to_chroma)
+    monkeypatch.setattr(se, "get_document_processor_registry", mocks.get_registry)
+    return mocks
+
+
+def test_main_function_success(main_mocks, work_dir):
+    """Test main function successful execution."""
+    # Mock successful document processing
+    mock_doc = SimpleNamespace(
+        page_content="test content", metadata={"source": "test.txt"}
+    )
+    main_mocks.iter_documents.return_value = iter([mock_doc])
+
+    # Mock vectorstore with search capability
+    mock_vectorstore = Mock()
+    mock_vectorstore.similarity_search.return_value = [mock_doc, mock_doc]
+    main_mocks.store_to_chroma.return_value = mock_vectorstore
+
+    # Call main function
+    main(data_source_dir=work_dir)
+
+    # Verify function calls
+    main_mocks.iter_documents.assert_called_once_with(work_dir)
+    main_mocks.store_to_chroma.assert_called_once()
+
+    # Verify search calls
+    assert mock_vectorstore.similarity_search.call_count == 2
+
+
+def test_main_function_streams_batches(main_mocks, work_dir, monkeypatch):
+    """Test main stores the first batch via store_to_chroma and appends the rest."""
+    monkeypatch.setattr(se, "EMBEDDING_BATCH_SIZE", 2)
+    docs = [Document(page_content=f"chunk {i}", metadata={}) for i in range(5)]
+    main_mocks.iter_documents.return_value = iter(docs)
+    mock_vectorstore = main_mocks.store_to_chroma.return_value
+    mock_vectorstore.similarity_search.return_value = []
+
+    main(data_source_dir=work_dir)
+
+    main_mocks.store_to_chroma.assert_called_once_with(docs[:2], se.ModelVendor.GOOGLE)
+    assert [c.args[0] for c in mock_vectorstore.add_documents.call_args_list] == [
+        docs[2:4],
+        docs[4:],
+    ]
+
+
+def test_main_function_no_documents(main_mocks, work_dir):
+    """Test main function when no documents found."""
+    # Mock no documents found
+    main_mocks.iter_documents.return_value = iter([])
+
+    # Mock registry for format listing
+    mock_processor = Mock()
+    mock_processor.file_type_description = "Test files"
+    main_mocks.get_registry.return_value.get_all_processors.return_value = {
+        "test": mock_processor
+    }
+
+    # Call main function
+    main(data_source_dir=work_dir)
+
+    # Verify it handles no documents case
+    main_mocks.iter_documents.assert_called_once_with(work_dir)
+    main_mocks.get_registry.assert_called_once()
+    main_mocks.store_to_chroma.assert_not_called()
+
+
+def test_main_function_exception(main_mocks, work_dir):
+    """Test main function exception handling."""
+    # Mock exception during processing
+    main_mocks.iter_documents.side_effect = Exception("Processing failed")
+
+    # Call main function - should not raise exception
+    main(data_source_dir=work_dir)
+
+    # Verify it attempted processing
+    main_mocks.iter_documents.assert_called_once_with(work_dir)
+    main_mocks.store_to_chroma.assert_not_called()
+
+
+def test_main_function_default_data_source_dir(main_mocks):
+    """Test main function falls back to the data_source dir next to the module."""
+    main_mocks.iter_documents.side_effect = Exception("stop after lookup")
+
+    main()
+
+    expected_dir = Path(se.__file__).parent / "data_source"
+    main_mocks.iter_documents.assert_called_once_with(expected_dir)
+
+
+def test_model_vendor_integration():
+    """Test that ModelVendor enum works with actual functions."""
+    # This test verifies the enum can be used with the functions
+    vendors = [ModelVendor.GOOGLE, ModelVendor.OPENAI]
+
+    for vendor in vendors:
+        assert vendor.value in ["google", "openai"]
+        assert isinstance(vendor, ModelVendor)
+
+
+def test_collection_name_parameter_signature():
+    """Test that store_to_chroma function signature includes collection_name parameter."""
+    # Plain attribute reads - no signature introspection needed
+    code = store_to_chroma.__code__
+    arg_names = code.co_varnames[: code.co_argcount]
+
+    # Verify collection_name parameter exists and is optional (last positional arg)
+    assert arg_names[-1] == "collection_name"
+    assert store_to_chroma.__defaults__ == (None,)
+    assert store_to_chroma.__annotations__["collection_name"] is str
+
+
+def test_default_collection_name_fallback():
+    """Test DEFAULT_COLLECTION_NAME reads from environment or falls back to 'rag-kb'."""
+    # Since we have a real .env file with CHROMADB_COLLECTION_NAME=test_rag_kb,
+    # the test should verify that the environment variable is being read correctly
+    expected_value = os.getenv("CHROMADB_COLLECTION_NAME", "rag-kb")
+
+    # Verify that DEFAULT_COLLECTION_NAME matches what we expect from the environment
+    assert DEFAULT_COLLECTION_NAME == expected_value
+
+
+def test_default_collection_name_from_env(monkeypatch):
+    """Test get_default_collection_name reads the environment at call time."""
+    monkeypatch.setenv("CHROMADB_COLLECTION_NAME", "test_custom_collection")
+
+    assert get_default_collection_name() == "test_custom_collection"
+
+
+def test_default_collection_name_getter_fallback(monkeypatch):
+    """Test get_default_collection_name falls back to 'rag-kb' when unset."""
+    monkeypatch.delenv("CHROMADB_COLLECTION_NAME", raising=False)
+
+    assert get_default_collection_name() == "rag-kb"
+
+
+@pytest.fixture(scope="session")
+def sample_doc():
+    """Plain-dict Document shared by the store_to_chroma tests (never mutated)."""
+    return Document(page_content="test content", metadata={"source": "test.txt"})
+
+
+@pytest.fixture
+def chroma_mocks(monkeypatch):
+    """Replace the ChromaDB client, embedding model and Chroma class with mocks."""
+    client = Mock()
+    embedding = Mock()
+    chroma = Mock()
+    monkeypatch.setattr(se, "get_chromadb_client", lambda *a, **kw: client)
+    monkeypatch.setattr(se, "load_embedding_model", lambda *a, **kw: embedding)
+    monkeypatch.setattr(se, "Chroma", chroma)
+    return SimpleNamespace(client=client, embedding=embedding, chroma=chroma)
+
+
+def test_store_to_chroma_uses_default_collection_name(chroma_mocks, sample_doc):
+    """Test store_to_chroma uses the default collection name when collection_name not specified."""
+    # Test function call without collection_name
+    result = store_to_chroma([sample_doc], ModelVendor.GOOGLE)
+
+    # Verify Chroma.from_documents was called with the default collection name
+    chroma_mocks.chroma.from_documents.assert_called_once()
+    call_args = chroma_mocks.chroma.from_documents.call_args
+    assert call_args[1]["collection_name"] == get_default_collection_name()
+    assert call_args[1]["client"] is chroma_mocks.client
+    assert call_args[1]["embedding"] is chroma_mocks.embedding
+    assert result is chroma_mocks.chroma.from_documents.return_value
+
+
+def test_store_to_chroma_uses_custom_collection_name(chroma_mocks, sample_doc):
+    """Test store_to_chroma uses provided collection_name when specified."""
+    custom_collection = "my_custom_collection"
+
+    # Test function call with custom collection_name
+    store_to_chroma([sample_doc], ModelVendor.GOOGLE, collection_name=custom_collection)
+
+    # Verify Chroma.from_documents was called with custom collection name
+    chroma_mocks.chroma.from_documents.assert_called_once()
+    call_args = chroma_mocks.chroma.from_documents.call_args
+    assert call_args[1]["collection_name"] == custom_collection
+
+
+def test_store_to_chroma_logs_collection_name(chroma_mocks, sample_doc, monkeypatch):
+    """Test store_to_chroma logs the collection name being used."""
+    mock_logger = Mock()
+    monkeypatch.setattr(se, "logger", mock_logger)
+
+    # Test function call with custom collection
+    custom_collection = "test_logging_collection"
+    store_to_chroma([sample_doc], ModelVendor.GOOGLE, collection_name=custom_collection)
+
+    # Verify logging was called with collection name
+    mock_logger.info.assert_called_once()
+    call_args = mock_logger.info.call_args[1]
+    assert call_args["collection_name"] == custom_collection
+
+
+def test_store_to_chroma_environment_integration(chroma_mocks, sample_doc, monkeypatch):
+    """Test store_to_chroma with environment variable integration."""
+    monkeypatch.setenv("CHROMADB_COLLECTION_NAME", "env_test_collection")
+
+    # Test function call without collection_name (should use env var)
+    store_to_chroma([sample_doc], ModelVendor.GOOGLE)
+
+    # Verify Chroma.from_documents was called with environment variable value
+    chroma_mocks.chroma.from_documents.assert_called_once()
+    call_args = chroma_mocks.chroma.from_documents.call_args
+    assert call_args[1]["collection_name"] == "env_test_collection"
+
+
+def test_store_to_chroma_stores_in_one_call(chroma_mocks):
+    """Test store_to_chroma leaves batching to the embedding SDK."""
+    docs = [Document(page_content=f"doc {i}", metadata={"i": i}) for i in range(5)]
+
+    result = store_to_chroma(docs, ModelVendor.GOOGLE)
+
+    stored = chroma_mocks.chroma.from_documents.call_args[1]["documents"]
+    assert [doc.metadata["i"] for doc in stored] == list(range(5))
+    vectorstore = chroma_mocks.chroma.from_documents.return_value
+    vectorstore.add_documents.assert_not_called()
+    assert result is vectorstore
+
+
+def test_aprocess_documents_from_directory_concurrent(mock_processor, work_dir):
+    """Test aprocess_documents_from_directory overlaps files and keeps directory order."""
+    for name in ("a.txt", "b.txt", "skip.xyz"):
+        (work_dir / name).touch()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def process_document(path):
+        barrier.wait()  # Only passes if both files are in flight together
+        return [SimpleNamespace(page_content=path.name, metadata={})]
+
+    mock_processor.process_document.side_effect = process_document
+
+    result = asyncio.run(aprocess_documents_from_directory(work_dir, concurrency=2))
+
+    expected = [p.name for p in work_dir.iterdir() if p.suffix == ".txt"]
+    assert [doc.page_content for doc in result] == expected
+
+
+def test_aprocess_documents_from_directory_parses_pdfs_in_process_pool(
+    work_dir, monkeypatch
+):
+    """Test aprocess_documents_from_directory sends PDFs to the shared process pool."""
+    for name in ("a.pdf", "b.pdf"):
+        pdf = fitz.open()
+        pdf.new_page().insert_text((72, 72), f"Content of {name}")
+        pdf.save(work_dir / name)
+        pdf.close()
+    (work_dir / "c.txt").write_text("Content of c.txt")
+    shared_pool = se.get_pdf_process_pool()
+    submitted = []
+
+    def submit(func, processor, path):
+        submitted.append(path)
+        return shared_pool.submit(func, processor, path)
+
+    monkeypatch.setattr(
+        se, "get_pdf_process_pool", lambda: SimpleNamespace(submit=submit)
+    )
+
+    result = asyncio.run(aprocess_documents_from_directory(work_dir, concurrency=2))
+
+    assert sorted(path.name for path in submitted) == ["a.pdf", "b.pdf"]
+    sources = [doc.metadata["source"] for doc in result]
+    assert list(dict.fromkeys(sources)) == [p.name for p in work_dir.iterdir()]
+    assert "Content of b.pdf" in result[sources.index("b.pdf")].page_content
+
+
+def test_aprocess_documents_from_directory_cancel_does_not_block_loop(
+    patch_registry, work_dir, monkeypatch
+):
+    """Test cancelling returns while a CPU-bound file is still being parsed."""
+    (work_dir / "slow.pdf").touch()
+    patch_registry.get_processor_for_file.return_value = SimpleNamespace(io_bound=False)
+    started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def process_file_safely(processor, file_path):
+        started.set()
+        release.wait(timeout=5)
+        finished.set()
+        return []
+
+    monkeypatch.setattr(se, "_process_file_safely", process_file_safely)
+
+    async def cancel_mid_parse(executor):
+        task = asyncio.create_task(
+            aprocess_documents_from_directory(work_dir, executor=executor)
         )
-        self.assertEqual(result, mock_model)
-
-    @unittest.skip("Environment isolation issue - .env loading at import time conflicts with test suite environment")
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}, clear=True)
-    @patch('rag_store.store_embeddings.OpenAIEmbeddings')
-    def test_load_embedding_model_openai(self, mock_openai_class):
-        """Test loading OpenAI embedding model."""
-        mock_model = Mock()
-        mock_openai_class.return_value = mock_model
-        
-        result = load_embedding_model(ModelVendor.OPENAI)
-        
-        mock_openai_class.assert_called_once_with(openai_api_key="test_key")
-        self.assertEqual(result, mock_model)
-
-    def test_process_pdf_files_empty_directory(self):
-        """Test processing PDF files from empty directory."""
-        # Create empty directory
-        empty_dir = self.temp_dir_path / "empty"
-        empty_dir.mkdir()
-
-        result = process_pdf_files(empty_dir)
-
-        self.assertEqual(len(result), 0)
-        self.assertIsInstance(result, list)
-
-    @patch("rag_store.store_embeddings.get_document_processor_registry")
-    def test_process_pdf_files_with_pdfs(self, mock_registry_func):
-        """Test processing PDF files from directory with PDFs."""
-        # Create mock PDF files
-        pdf1 = self.temp_dir_path / "test1.pdf"
-        pdf2 = self.temp_dir_path / "test2.pdf"
-        pdf1.touch()
-        pdf2.touch()
-
-        # Mock registry and processor
-        mock_registry = Mock()
-        mock_registry_func.return_value = mock_registry
-        mock_registry.process_document.return_value = [
-            Mock(page_content="Test content", metadata={"source": "test1.pdf"})
-        ]
-
-        result = process_pdf_files(self.temp_dir_path)
-
-        # Should process both PDF files
-        self.assertEqual(mock_registry.process_document.call_count, 2)
-        self.assertEqual(len(result), 2)  # 2 PDFs × 1 document each
-
-    def test_process_text_files_empty_directory(self):
-        """Test processing text files from empty directory."""
-        # Create empty directory
-        empty_dir = self.temp_dir_path / "empty"
-        empty_dir.mkdir()
-
-        result = process_text_files(empty_dir)
-
-        self.assertEqual(len(result), 0)
-        self.assertIsInstance(result, list)
-
-    @patch("rag_store.store_embeddings.get_document_processor_registry")
-    def test_process_text_files_with_texts(self, mock_registry_func):
-        """Test processing text files from directory with text files."""
-        # Create mock text files
-        txt1 = self.temp_dir_path / "test1.txt"
-        txt2 = self.temp_dir_path / "test2.txt"
-        txt1.touch()
-        txt2.touch()
-
-        # Mock registry and processor
-        mock_registry = Mock()
-        mock_registry_func.return_value = mock_registry
-        mock_registry.process_document.return_value = [
-            Mock(page_content="Test content", metadata={"source": "test.txt"})
-        ]
-
-        result = process_text_files(self.temp_dir_path)
-
-        # Should process both text files
-        self.assertEqual(mock_registry.process_document.call_count, 2)
-        self.assertEqual(len(result), 2)  # 2 text files × 1 document each
-
-    @patch("rag_store.store_embeddings.get_document_processor_registry")
-    def test_process_documents_from_directory_unified(self, mock_registry_func):
-        """Test the new unified document processing function."""
-        # Create mixed file types
-        pdf_file = self.temp_dir_path / "test.pdf"
-        txt_file = self.temp_dir_path / "test.txt"
-        md_file = self.temp_dir_path / "test.md"
-        unsupported_file = self.temp_dir_path / "test.xyz"
-
-        pdf_file.touch()
-        txt_file.touch()
-        md_file.touch()
-        unsupported_file.touch()
-
-        # Mock registry
-        mock_registry = Mock()
-        mock_registry_func.return_value = mock_registry
-        mock_registry.get_supported_extensions.return_value = {".pdf", ".txt", ".md"}
-
-        # Mock processor selection
-        def mock_get_processor(file_path):
-            if file_path.suffix in {".pdf", ".txt", ".md"}:
-                return Mock()  # Return a mock processor
-            return None
-
-        mock_registry.get_processor_for_file.side_effect = mock_get_processor
-        mock_registry.process_document.return_value = [
-            Mock(page_content="Test content", metadata={"source": "test.pdf"})
-        ]
-
-        result = process_documents_from_directory(self.temp_dir_path)
-
-        # Should process 3 supported files (pdf, txt, md) but not xyz
-        self.assertEqual(mock_registry.process_document.call_count, 3)
-        self.assertEqual(len(result), 3)  # 3 supported files × 1 document each
-
-
-class TestStoreEmbeddingsErrorHandling(unittest.TestCase):
-    """Test error handling in store_embeddings module."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-
-    def test_process_documents_from_directory_no_processor_found(self):
-        """Test process_documents_from_directory when no processor found for file."""
-        # Create a file with unsupported extension
-        unsupported_file = Path(self.temp_dir) / "test.xyz"
-        unsupported_file.write_text("test content")
-
-        # Process should handle the unsupported file gracefully
-        documents = process_documents_from_directory(Path(self.temp_dir))
-        
-        # Should return empty list since no processors support .xyz files
-        self.assertEqual(documents, [])
-
-    def test_process_documents_from_directory_processing_error(self):
-        """Test process_documents_from_directory when document processing fails."""
-        # Create a text file
-        text_file = Path(self.temp_dir) / "test.txt"
-        text_file.write_text("test content")
-
-        # Mock processor registry to raise an exception
-        with patch('rag_store.store_embeddings.get_document_processor_registry') as mock_registry:
-            mock_registry_instance = Mock()
-            mock_registry.return_value = mock_registry_instance
-            
-            # Mock processor that raises exception
-            mock_processor = Mock()
-            mock_processor.file_type_description = "Text files"
-            mock_processor.processor_name = "TextProcessor"
-            mock_registry_instance.get_processor_for_file.return_value = mock_processor
-            mock_registry_instance.process_document.side_effect = Exception("Processing failed")
-            mock_registry_instance.get_supported_extensions.return_value = {'.txt'}
-
-            # Process should handle the exception gracefully
-            documents = process_documents_from_directory(Path(self.temp_dir))
-            
-            # Should return empty list due to processing error
-            self.assertEqual(documents, [])
-
-    def test_process_documents_from_directory_empty_directory(self):
-        """Test process_documents_from_directory with empty directory."""
-        # Test with empty directory
-        documents = process_documents_from_directory(Path(self.temp_dir))
-        
-        # Should return empty list and log warning
-        self.assertEqual(documents, [])
-
-    def test_load_txt_documents_function(self):
-        """Test the legacy load_txt_documents function."""
-        # Create a text file
-        text_file = Path(self.temp_dir) / "test.txt"
-        text_file.write_text("test content")
-
-        # Mock the registry
-        with patch('rag_store.store_embeddings.get_document_processor_registry') as mock_registry:
-            mock_registry_instance = Mock()
-            mock_registry.return_value = mock_registry_instance
-            
-            # Mock successful processing
-            mock_doc = Mock()
-            mock_doc.page_content = "test content"
-            mock_registry_instance.process_document.return_value = [mock_doc]
-
-            # Test the function
-            documents = load_txt_documents(text_file)
-            
-            # Verify it uses the registry correctly
-            mock_registry_instance.process_document.assert_called_once_with(text_file)
-            self.assertEqual(len(documents), 1)
-
-    @unittest.skip("Environment isolation issue - .env loading at import time conflicts with test suite environment")
-    @patch.dict(os.environ, {}, clear=True)
-    def test_load_embedding_model_missing_google_key(self):
-        """Test load_embedding_model with missing GOOGLE_API_KEY."""
-        with self.assertRaises(ValueError) as context:
-            load_embedding_model(ModelVendor.GOOGLE)
-        
-        self.assertIn("GOOGLE_API_KEY environment variable is required", str(context.exception))
-
-    @unittest.skip("Environment isolation issue - .env loading at import time conflicts with test suite environment")
-    @patch.dict(os.environ, {}, clear=True)
-    def test_load_embedding_model_missing_openai_key(self):
-        """Test load_embedding_model with missing OPENAI_API_KEY."""
-        with self.assertRaises(ValueError) as context:
-            load_embedding_model(ModelVendor.OPENAI)
-        
-        self.assertIn("OPENAI_API_KEY environment variable is required", str(context.exception))
-
-    def test_get_text_splitter_function(self):
-        """Test the get_text_splitter function."""
-        splitter = get_text_splitter()
-        
-        # Verify splitter configuration
-        self.assertEqual(splitter._chunk_size, 300)
-        self.assertEqual(splitter._chunk_overlap, 50)
-        self.assertEqual(splitter._separator, "\n")
-
-
-class TestMainFunction(unittest.TestCase):
-    """Test the main function for coverage."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-
-    @patch('rag_store.store_embeddings.process_documents_from_directory')
-    @patch('rag_store.store_embeddings.store_to_chroma')
-    @patch('rag_store.store_embeddings.Path')
-    def test_main_function_success(self, mock_path, mock_store_to_chroma, mock_process_docs):
-        """Test main function successful execution."""
-        from rag_store.store_embeddings import main
-        
-        # Mock path for data_source directory
-        mock_data_source_dir = Mock()
-        mock_path.return_value.parent.__truediv__.return_value = mock_data_source_dir
-        
-        # Mock successful document processing
-        mock_doc = Mock()
-        mock_doc.page_content = "test content"
-        mock_doc.metadata = {"source": "test.txt"}
-        mock_process_docs.return_value = [mock_doc]
-        
-        # Mock vectorstore with search capability
-        mock_vectorstore = Mock()
-        mock_vectorstore.similarity_search.return_value = [mock_doc, mock_doc]
-        mock_store_to_chroma.return_value = mock_vectorstore
-        
-        # Call main function
-        main()
-        
-        # Verify function calls
-        mock_process_docs.assert_called_once()
-        mock_store_to_chroma.assert_called_once()
-        
-        # Verify search calls
-        self.assertEqual(mock_vectorstore.similarity_search.call_count, 2)
-
-    @patch('rag_store.store_embeddings.process_documents_from_directory')
-    @patch('rag_store.store_embeddings.get_document_processor_registry')
-    @patch('rag_store.store_embeddings.Path')
-    def test_main_function_no_documents(self, mock_path, mock_get_registry, mock_process_docs):
-        """Test main function when no documents found."""
-        from rag_store.store_embeddings import main
-        
-        # Mock path for data_source directory
-        mock_data_source_dir = Mock()
-        mock_path.return_value.parent.__truediv__.return_value = mock_data_source_dir
-        
-        # Mock no documents found
-        mock_process_docs.return_value = []
-        
-        # Mock registry for format listing
-        mock_registry = Mock()
-        mock_processor = Mock()
-        mock_processor.file_type_description = "Test files"
-        mock_registry.get_all_processors.return_value = {"test": mock_processor}
-        mock_get_registry.return_value = mock_registry
-        
-        # Call main function
-        main()
-        
-        # Verify it handles no documents case
-        mock_process_docs.assert_called_once()
-        mock_get_registry.assert_called_once()
-
-    @patch('rag_store.store_embeddings.process_documents_from_directory')
-    @patch('rag_store.store_embeddings.Path')
-    def test_main_function_exception(self, mock_path, mock_process_docs):
-        """Test main function exception handling."""
-        from rag_store.store_embeddings import main
-        
-        # Mock path for data_source directory
-        mock_data_source_dir = Mock()
-        mock_path.return_value.parent.__truediv__.return_value = mock_data_source_dir
-        
-        # Mock exception during processing
-        mock_process_docs.side_effect = Exception("Processing failed")
-        
-        # Call main function - should not raise exception
-        main()
-        
-        # Verify it attempted processing
-        mock_process_docs.assert_called_once()
-
-
-class TestStoreEmbeddingsIntegration(unittest.TestCase):
-    """Integration tests for store_embeddings functionality."""
-
-    def test_model_vendor_integration(self):
-        """Test that ModelVendor enum works with actual functions."""
-        # This test verifies the enum can be used with the functions
-        vendors = [ModelVendor.GOOGLE, ModelVendor.OPENAI]
-
-        for vendor in vendors:
-            self.assertIn(vendor.value, ["google", "openai"])
-            self.assertIsInstance(vendor, ModelVendor)
-
-
-class TestCollectionNameConfiguration(unittest.TestCase):
-    """Test cases for collection name configuration functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Store original environment variables
-        self.original_env = dict(os.environ)
-
-    def tearDown(self):
-        """Clean up after each test."""
-        # Restore original environment variables
-        os.environ.clear()
-        os.environ.update(self.original_env)
-
-    @patch.dict(os.environ, {"CHROMADB_COLLECTION_NAME": "test_custom_collection"})
-    def test_default_collection_name_from_env(self):
-        """Test DEFAULT_COLLECTION_NAME reads from environment variable."""
-        # Import the module to trigger environment loading
-        import importlib
-        import rag_store.store_embeddings
-        importlib.reload(rag_store.store_embeddings)
-        
-        from rag_store.store_embeddings import DEFAULT_COLLECTION_NAME
-        
-        self.assertEqual(DEFAULT_COLLECTION_NAME, "test_custom_collection")
-
-    def test_default_collection_name_fallback(self):
-        """Test DEFAULT_COLLECTION_NAME reads from environment or falls back to 'rag-kb'."""
-        from rag_store.store_embeddings import DEFAULT_COLLECTION_NAME
-        
-        # Since we have a real .env file with CHROMADB_COLLECTION_NAME=test_rag_kb,
-        # the test should verify that the environment variable is being read correctly
-        expected_value = os.getenv("CHROMADB_COLLECTION_NAME", "rag-kb")
-        
-        # Verify that DEFAULT_COLLECTION_NAME matches what we expect from the environment
-        self.assertEqual(DEFAULT_COLLECTION_NAME, expected_value)
-
-    @patch("rag_store.store_embeddings.get_chromadb_client")
-    @patch("rag_store.store_embeddings.load_embedding_model")
-    @patch("rag_store.store_embeddings.Chroma")
-    def test_store_to_chroma_uses_default_collection_name(self, mock_chroma, mock_embedding, mock_client):
-        """Test store_to_chroma uses DEFAULT_COLLECTION_NAME when collection_name not specified."""
-        # Mock dependencies
-        mock_client.return_value = Mock()
-        mock_embedding.return_value = Mock()
-        mock_vectorstore = Mock()
-        mock_chroma.from_documents.return_value = mock_vectorstore
-        
-        # Mock document with proper attributes
-        from langchain.schema import Document
-        mock_doc = Document(page_content="test content", metadata={"source": "test.txt"})
-        
-        from rag_store.store_embeddings import store_to_chroma, ModelVendor, DEFAULT_COLLECTION_NAME
-        
-        # Test function call without collection_name
-        result = store_to_chroma([mock_doc], ModelVendor.GOOGLE)
-        
-        # Verify Chroma.from_documents was called with DEFAULT_COLLECTION_NAME
-        mock_chroma.from_documents.assert_called_once()
-        call_args = mock_chroma.from_documents.call_args
-        self.assertEqual(call_args[1]["collection_name"], DEFAULT_COLLECTION_NAME)
-
-    @patch("rag_store.store_embeddings.get_chromadb_client")
-    @patch("rag_store.store_embeddings.load_embedding_model")
-    @patch("rag_store.store_embeddings.Chroma")
-    def test_store_to_chroma_uses_custom_collection_name(self, mock_chroma, mock_embedding, mock_client):
-        """Test store_to_chroma uses provided collection_name when specified."""
-        # Mock dependencies
-        mock_client.return_value = Mock()
-        mock_embedding.return_value = Mock()
-        mock_vectorstore = Mock()
-        mock_chroma.from_documents.return_value = mock_vectorstore
-        
-        # Mock document with proper attributes
-        from langchain.schema import Document
-        mock_doc = Document(page_content="test content", metadata={"source": "test.txt"})
-        
-        from rag_store.store_embeddings import store_to_chroma, ModelVendor
-        
-        custom_collection = "my_custom_collection"
-        
-        # Test function call with custom collection_name
-        result = store_to_chroma([mock_doc], ModelVendor.GOOGLE, collection_name=custom_collection)
-        
-        # Verify Chroma.from_documents was called with custom collection name
-        mock_chroma.from_documents.assert_called_once()
-        call_args = mock_chroma.from_documents.call_args
-        self.assertEqual(call_args[1]["collection_name"], custom_collection)
-
-    @patch("rag_store.store_embeddings.get_chromadb_client")
-    @patch("rag_store.store_embeddings.load_embedding_model") 
-    @patch("rag_store.store_embeddings.Chroma")
-    def test_store_to_chroma_logs_collection_name(self, mock_chroma, mock_embedding, mock_client):
-        """Test store_to_chroma logs the collection name being used."""
-        # Mock dependencies
-        mock_client.return_value = Mock()
-        mock_embedding.return_value = Mock()
-        mock_vectorstore = Mock()
-        mock_chroma.from_documents.return_value = mock_vectorstore
-        
-        # Mock document with proper attributes
-        from langchain.schema import Document
-        mock_doc = Document(page_content="test content", metadata={"source": "test.txt"})
-        
-        from rag_store.store_embeddings import store_to_chroma, ModelVendor
-        
-        with patch("rag_store.store_embeddings.logger") as mock_logger:
-            # Test function call with custom collection
-            custom_collection = "test_logging_collection"
-            result = store_to_chroma([mock_doc], ModelVendor.GOOGLE, collection_name=custom_collection)
-            
-            # Verify logging was called with collection name
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args[1]
-            self.assertEqual(call_args["collection_name"], custom_collection)
-
-    @patch("rag_store.store_embeddings.get_chromadb_client")
-    @patch("rag_store.store_embeddings.load_embedding_model")
-    @patch("rag_store.store_embeddings.Chroma")
-    @patch("rag_store.store_embeddings.DEFAULT_COLLECTION_NAME", "env_test_collection")
-    def test_store_to_chroma_environment_integration(self, mock_chroma, mock_embedding, mock_client):
-        """Test store_to_chroma with environment variable integration."""
-        # Mock dependencies
-        mock_client.return_value = Mock()
-        mock_embedding.return_value = Mock()
-        mock_vectorstore = Mock()
-        mock_chroma.from_documents.return_value = mock_vectorstore
-        
-        # Mock document with proper attributes
-        from langchain.schema import Document
-        mock_doc = Document(page_content="test content", metadata={"source": "test.txt"})
-        
-        from rag_store.store_embeddings import store_to_chroma, ModelVendor
-        
-        # Test function call without collection_name (should use env var)
-        result = store_to_chroma([mock_doc], ModelVendor.GOOGLE)
-        
-        # Verify Chroma.from_documents was called with environment variable value
-        mock_chroma.from_documents.assert_called_once()
-        call_args = mock_chroma.from_documents.call_args
-        self.assertEqual(call_args[1]["collection_name"], "env_test_collection")
-
-    def test_collection_name_parameter_signature(self):
-        """Test that store_to_chroma function signature includes collection_name parameter."""
-        import inspect
-        from rag_store.store_embeddings import store_to_chroma
-        
-        signature = inspect.signature(store_to_chroma)
-        parameters = signature.parameters
-        
-        # Verify collection_name parameter exists and is optional
-        self.assertIn("collection_name", parameters)
-        self.assertEqual(parameters["collection_name"].default, None)
-        self.assertEqual(parameters["collection_name"].annotation, str)
-
-
-if __name__ == "__main__":
-    unittest.main(verbosity=2)
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=1)
+        return finished.is_set()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            # The worker is still parsing when the cancellation lands
+            assert asyncio.run(cancel_mid_parse(executor)) is False
+        finally:
+            release.set()
+
+
+def test_aprocess_documents_from_directory_missing_directory(patch_registry, work_dir):
+    """Test aprocess_documents_from_directory raises for a missing directory."""
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(aprocess_documents_from_directory(work_dir / "missing"))
+
+
+def test_astore_to_chroma_adds_batches(chroma_mocks, monkeypatch):
+    """Test astore_to_chroma stores documents batch by batch."""
+    monkeypatch.setenv("CHROMADB_COLLECTION_NAME", "async_collection")
+    docs = [Document(page_content=f"doc {i}", metadata={"i": i}) for i in range(5)]
+
+    result = asyncio.run(astore_to_chroma(docs, ModelVendor.GOOGLE, batch_size=2))
+
+    chroma_mocks.chroma.assert_called_once_with(
+        client=chroma_mocks.client,
+        collection_name="async_collection",
+        embedding_function=chroma_mocks.embedding,
+    )
+    vectorstore = chroma_mocks.chroma.return_value
+    batches = [c.args[0] for c in vectorstore.add_documents.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+    assert sorted(doc.metadata["i"] for batch in batches for doc in batch) == list(
+        range(5)
+    )
+    assert result is vectorstore
+
+
+def test_astore_to_chroma_loads_model_off_event_loop(chroma_mocks, monkeypatch):
+    """Test astore_to_chroma loads the embedding model in a worker thread."""
+    load_threads = []
+
+    def load_embedding_model(model_vendor):
+        load_threads.append(threading.get_ident())
+        return chroma_mocks.embedding
+
+    monkeypatch.setattr(se, "load_embedding_model", load_embedding_model)
+
+    asyncio.run(astore_to_chroma([Document(page_content="doc")], ModelVendor.GOOGLE))
+
+    assert len(load_threads) == 1
+    assert load_threads[0] != threading.get_ident()
@@ -8,14 +8,12 @@ including document processing, metadata generation, and error handling.
 import shutil
 
 # Import the modules to test
-import sys
 import tempfile
 import unittest
 
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from langchain.schema import Document
 
 from rag_store.word_processor import WordProcessor